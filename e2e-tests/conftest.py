@@ -8,10 +8,16 @@ Supports multiple platforms via ZAJEL_TEST_PLATFORM env var:
 
 Provides fixtures for:
 - Single device (alice, bob)
-- Device pairs for P2P testing
+- Device pairs for P2P testing (paired once per class, or per test)
 - All available devices
 - Headless client (HeadlessBob) for cross-platform testing
 - Platform-aware app_helper factory
+
+Android runs can be split across emulators with pytest-xdist, e.g.
+``pytest -n 2 --dist=loadscope``. Each worker drives its own block of
+Appium servers; loadscope keeps each test class (and its class-scoped
+pairing or app) on one worker while different classes, even from the
+same file, run in parallel.
 """
 
 from __future__ import annotations
@@ -25,6 +31,8 @@ import threading
 import pytest
 
 from platforms import get_platform, get_config, create_helper
+from pairing import pair_devices
+from polling import wait_until
 
 # ── Platform detection ───────────────────────────────────────────
 
@@ -43,23 +51,27 @@ if PLATFORM == "android":
         from appium.options.android import UiAutomator2Options
         config = get_config()
         from platforms.android_config import (
-            get_server_url, APK_PATH, SERVER_COUNT, APP_LAUNCH_TIMEOUT, ADB_PATH,
-            SIGNALING_URL,
+            get_server_url, get_global_index, APK_PATH, APP_LAUNCH_TIMEOUT,
+            ADB_PATH, SIGNALING_URL, SYSTEM_PORT_BASE, MJPEG_SERVER_PORT_BASE,
+            P2P_CONNECTION_TIMEOUT, IMPLICIT_WAIT,
         )
+        # Under pytest-xdist each worker only sees its own block of servers
+        from platforms.android_config import SERVERS_PER_WORKER as SERVER_COUNT
         HAS_APPIUM = True
     except ImportError:
         HAS_APPIUM = False
         SERVER_COUNT = 0
         APP_LAUNCH_TIMEOUT = 60
+        P2P_CONNECTION_TIMEOUT = 15
         SIGNALING_URL = os.environ.get("SIGNALING_URL", "")
 elif PLATFORM == "linux":
     from platforms.linux_config import (
         APP_PATH, DATA_DIR_1, DATA_DIR_2, SIGNALING_URL,
-        APP_LAUNCH_TIMEOUT,
+        APP_LAUNCH_TIMEOUT, P2P_CONNECTION_TIMEOUT,
     )
 elif PLATFORM == "windows":
     from platforms.windows_config import (
-        APP_PATH, SIGNALING_URL, APP_LAUNCH_TIMEOUT,
+        APP_PATH, SIGNALING_URL, APP_LAUNCH_TIMEOUT, P2P_CONNECTION_TIMEOUT,
     )
 else:
     SIGNALING_URL = os.environ.get("SIGNALING_URL", "")
@@ -113,10 +125,13 @@ def _require_appium():
         pytest.skip("Appium not installed -- skipping emulator tests")
 
 
-def create_driver(server_index: int, device_name: str = "emulator"):
-    """Create an Appium driver for the server at given index (Android only)."""
-    emulator_port = 5554 + (server_index * 2)
-    udid = f"emulator-{emulator_port}"
+def _udid_for(server_index: int) -> str:
+    """Emulator serial paired with the worker-local Appium server index."""
+    return f"emulator-{5554 + (get_global_index(server_index) * 2)}"
+
+
+def _reset_app_data(udid: str):
+    """Clear app data and re-grant runtime permissions via adb (Android only)."""
     try:
         subprocess.run(
             [ADB_PATH, "-s", udid, "shell", "pm", "clear", PACKAGE_NAME],
@@ -140,6 +155,17 @@ def create_driver(server_index: int, device_name: str = "emulator"):
         except (subprocess.CalledProcessError, FileNotFoundError, OSError):
             pass
 
+
+# Devices whose UiAutomator2 server was installed by an earlier session in
+# this run; later sessions on them skip the reinstall check.
+_server_installed_udids: set = set()
+
+
+def create_driver(server_index: int, device_name: str = "emulator"):
+    """Create an Appium driver for the server at given index (Android only)."""
+    udid = _udid_for(server_index)
+    _reset_app_data(udid)
+
     options = UiAutomator2Options()
     options.app = APK_PATH
     options.device_name = f"{device_name}-{server_index}"
@@ -158,30 +184,120 @@ def create_driver(server_index: int, device_name: str = "emulator"):
     options.set_capability("skipUnlock", True)
     options.set_capability("disableWindowAnimation", True)
     options.set_capability("forceAppLaunch", True)
+    if udid in _server_installed_udids:
+        options.set_capability("skipServerInstallation", True)
+    # Distinct host ports per device so parallel xdist workers don't collide
+    global_index = get_global_index(server_index)
+    options.set_capability("systemPort", SYSTEM_PORT_BASE + global_index)
+    options.set_capability("mjpegServerPort", MJPEG_SERVER_PORT_BASE + global_index)
 
     driver = webdriver.Remote(get_server_url(server_index), options=options)
-    driver.implicitly_wait(5)
+    _server_installed_udids.add(udid)
+    driver.implicitly_wait(IMPLICIT_WAIT)
+    # UiAutomator2 otherwise waits up to 10s for the UI thread to go idle
+    # before every lookup and action; Flutter's frame scheduler rarely
+    # reports idle, so that wait dominated each _find.
+    driver.update_settings({
+        "waitForIdleTimeout": 100,
+        "waitForSelectorTimeout": 100,
+        "actionAcknowledgmentTimeout": 100,
+        "keyInjectionDelay": 0,
+    })
+    return driver
+
+
+# Appium sessions reused across tests, keyed by server index (Android only)
+_session_drivers: dict = {}
+
+
+def reset_app(driver, server_index: int):
+    """Return a reused session's app to a freshly installed state.
+
+    Terminates the app, clears its data, re-grants permissions and
+    relaunches it -- a few seconds, versus a new Appium session which also
+    restarts the UiAutomator2 server and re-checks the APK install.
+    """
+    driver.terminate_app(PACKAGE_NAME)
+    _reset_app_data(_udid_for(server_index))
+    driver.activate_app(PACKAGE_NAME)
+
+
+def get_session_driver(server_index: int, device_name: str = "emulator"):
+    """Return a live Appium session for the server, with the app reset.
+
+    The first call creates the session; later calls reuse it and only
+    reset the app. A session that no longer responds is replaced.
+    """
+    driver = _session_drivers.get(server_index)
+    if driver is not None:
+        try:
+            reset_app(driver, server_index)
+            return driver
+        except Exception as e:
+            print(f"Warning: Appium session {server_index} unusable, recreating: {e}")
+            try:
+                driver.quit()
+            except Exception:
+                pass
+    driver = create_driver(server_index, device_name)
+    _session_drivers[server_index] = driver
     return driver
 
 
+def _helper_for(driver):
+    """Return the AppHelper for an Android driver, one per driver.
+
+    Sessions are reused across tests and fixtures, so the helper is cached
+    on the driver itself rather than rebuilt by each caller.
+    """
+    from platforms.android_helper import AppHelper
+
+    helper = getattr(driver, "_zajel_helper", None)
+    if helper is None:
+        helper = driver._zajel_helper = AppHelper(driver)
+    return helper
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Quit the Appium sessions kept alive across tests."""
+    while _session_drivers:
+        _, driver = _session_drivers.popitem()
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
 # ── Platform-dispatched fixtures ─────────────────────────────────
 
+@pytest.fixture(scope="session")
+def windows_app_session():
+    """Windows app process shared across the whole session (Windows only).
+
+    The helper's launch() is idempotent, so each test reuses the running
+    process and only resets navigation instead of cold-starting Flutter.
+    """
+    helper = create_helper("windows", app_path=APP_PATH)
+    yield helper
+    helper.stop()
+
+
 @pytest.fixture(scope="function")
-def alice():
+def alice(request):
     """First device/app instance (Alice).
 
     Returns:
-        - Android: Appium Remote driver
+        - Android: Appium Remote driver (session reused, app data cleared)
         - Linux: LinuxAppHelper instance (launched and ready)
-        - Windows: WindowsAppHelper instance (launched and ready)
+        - Windows: WindowsAppHelper instance (launched, on the home screen)
     """
     if PLATFORM == "android":
         _require_appium()
-        driver = create_driver(0, "alice")
+        # The Appium session outlives the test; only the app is reset
+        driver = get_session_driver(0, "alice")
         _active_drivers["alice"] = driver
         yield driver
         _active_drivers.pop("alice", None)
-        driver.quit()
 
     elif PLATFORM == "linux":
         if os.path.exists(DATA_DIR_1):
@@ -193,11 +309,10 @@ def alice():
         helper.stop()
 
     elif PLATFORM == "windows":
-        helper = create_helper("windows", app_path=APP_PATH)
+        helper = request.getfixturevalue("windows_app_session")
         helper.launch()
-        helper.wait_for_app_ready()
+        helper.reset_to_home()
         yield helper
-        helper.stop()
 
 
 @pytest.fixture(scope="function")
@@ -205,7 +320,8 @@ def bob():
     """Second device/app instance (Bob).
 
     Returns:
-        - Android: Appium Remote driver (requires >= 2 Appium servers)
+        - Android: Appium Remote driver (requires >= 2 Appium servers;
+          session reused, app data cleared)
         - Linux: LinuxAppHelper instance (second data dir)
         - Windows: not supported (skip)
     """
@@ -213,11 +329,10 @@ def bob():
         _require_appium()
         if SERVER_COUNT < 2:
             pytest.skip("Need at least 2 Appium servers for this test")
-        driver = create_driver(1, "bob")
+        driver = get_session_driver(1, "bob")
         _active_drivers["bob"] = driver
         yield driver
         _active_drivers.pop("bob", None)
-        driver.quit()
 
     elif PLATFORM == "linux":
         if os.path.exists(DATA_DIR_2):
@@ -240,11 +355,19 @@ def charlie():
     _require_appium()
     if SERVER_COUNT < 3:
         pytest.skip("Need at least 3 Appium servers for this test")
-    driver = create_driver(2, "charlie")
+    driver = get_session_driver(2, "charlie")
     _active_drivers["charlie"] = driver
     yield driver
     _active_drivers.pop("charlie", None)
-    driver.quit()
+
+
+@pytest.fixture(scope="session")
+def alice_udid():
+    """adb serial of Alice's emulator for this xdist worker (Android only)."""
+    if PLATFORM != "android":
+        pytest.skip("alice_udid fixture is only available on Android")
+    _require_appium()
+    return _udid_for(0)
 
 
 @pytest.fixture(scope="function")
@@ -253,19 +376,83 @@ def device_pair(alice, bob):
     return {"alice": alice, "bob": bob}
 
 
+@pytest.fixture(scope="class")
+def alice_app():
+    """Alice's app, reset once and shared by a whole test class (Android only).
+
+    Yields an AppHelper with the app ready. For single-device tests whose
+    changes don't matter to each other: the data reset and cold start run
+    once per class instead of once per test. Tests start from wherever the
+    previous test left the UI, so they should go back home first.
+    """
+    if PLATFORM != "android":
+        pytest.skip("alice_app fixture is only available on Android")
+    _require_appium()
+
+    driver = get_session_driver(0, "alice")
+    _active_drivers["alice"] = driver
+    try:
+        helper = _helper_for(driver)
+        helper.wait_for_app_ready()
+        yield helper
+    finally:
+        _active_drivers.pop("alice", None)
+
+
+@pytest.fixture(scope="class")
+def paired_devices():
+    """Alice and Bob paired once and shared by a whole test class (Android only).
+
+    Yields (alice_helper, bob_helper). Tests start from wherever the
+    previous test left the UI, so they should go back home first. The app
+    persists the pairing, so restarting it is fine; a test whose outcome
+    depends on a live connection it then breaks belongs in a separate
+    class marked destructive, using fresh_paired_devices instead.
+    """
+    if PLATFORM != "android":
+        pytest.skip("paired_devices fixture is only available on Android")
+    _require_appium()
+    if SERVER_COUNT < 2:
+        pytest.skip("Need at least 2 Appium servers for this test")
+
+    alice_driver = get_session_driver(0, "alice")
+    bob_driver = get_session_driver(1, "bob")
+    _active_drivers["alice"] = alice_driver
+    _active_drivers["bob"] = bob_driver
+    try:
+        alice_helper = _helper_for(alice_driver)
+        bob_helper = _helper_for(bob_driver)
+        assert pair_devices(alice_helper, bob_helper), "Devices must be paired"
+        yield alice_helper, bob_helper
+    finally:
+        _active_drivers.pop("alice", None)
+        _active_drivers.pop("bob", None)
+
+
+@pytest.fixture(scope="function")
+def fresh_paired_devices(alice, bob):
+    """Alice and Bob paired for one test that may break the pairing (Android only).
+
+    Yields (alice_helper, bob_helper) like paired_devices, but on the
+    function-scoped alice/bob drivers, so restarts and disconnects do not
+    leak into other tests.
+    """
+    if PLATFORM != "android":
+        pytest.skip("fresh_paired_devices fixture is only available on Android")
+
+    alice_helper = _helper_for(alice)
+    bob_helper = _helper_for(bob)
+    assert pair_devices(alice_helper, bob_helper), "Devices must be paired"
+    return alice_helper, bob_helper
+
+
 @pytest.fixture(scope="function")
 def all_devices():
-    """All available devices (Android only)."""
+    """All available devices (Android only), sessions reused like alice's."""
     if PLATFORM != "android":
         pytest.skip("all_devices fixture is only available on Android")
     _require_appium()
-    drivers = []
-    for i in range(SERVER_COUNT):
-        driver = create_driver(i, f"device-{i}")
-        drivers.append(driver)
-    yield drivers
-    for driver in drivers:
-        driver.quit()
+    return [get_session_driver(i, f"device-{i}") for i in range(SERVER_COUNT)]
 
 
 @pytest.fixture
@@ -273,7 +460,7 @@ def app_helper(request):
     """Factory fixture for creating platform helpers.
 
     Usage:
-        - Android: helper = app_helper(driver)
+        - Android: helper = app_helper(driver)  (one cached helper per driver)
         - Linux/Windows: helper = app_helper(alice)  (alice is already a helper)
 
     On Linux/Windows, this is a pass-through since the alice/bob fixtures
@@ -281,12 +468,7 @@ def app_helper(request):
     """
     if PLATFORM == "android":
         _require_appium()
-        from platforms.android_helper import AppHelper
-
-        def _create_helper(driver):
-            return AppHelper(driver)
-
-        return _create_helper
+        return _helper_for
     else:
         # On desktop platforms, alice/bob are already helpers
         def _passthrough(helper):
@@ -348,6 +530,18 @@ class HeadlessBob:
             self._client.receive_message(timeout=timeout), timeout=timeout + 10
         )
 
+    def drain_messages(self) -> int:
+        """Discard received text messages nobody consumed; returns the count."""
+        async def _drain():
+            queue = self._client._message_queue
+            count = 0
+            while not queue.empty():
+                queue.get_nowait()
+                count += 1
+            return count
+
+        return self._run(_drain(), timeout=10)
+
     def send_file(self, peer_id: str, file_path: str):
         return self._run(self._client.send_file(peer_id, file_path))
 
@@ -365,13 +559,8 @@ class HeadlessBob:
         self._thread.join(timeout=5)
 
 
-@pytest.fixture(scope="function")
-def headless_bob():
-    """Headless client acting as Bob for cross-platform tests.
-
-    Connects to the signaling server, auto-accepts pair requests.
-    Tests use headless_bob.pairing_code to pair Alice (app) with Bob.
-    """
+def _start_headless_bob() -> HeadlessBob:
+    """Create and connect the headless Bob used by the headless fixtures."""
     if not SIGNALING_URL:
         pytest.skip("SIGNALING_URL not set -- headless tests require a signaling server")
 
@@ -396,7 +585,112 @@ def headless_bob():
         auto_accept_pairs=True,
         log_level="DEBUG",
         ice_servers=ice_servers,
+        db_path=":memory:",
     )
     bob.connect()
+    return bob
+
+
+@pytest.fixture(scope="function")
+def headless_bob():
+    """Headless client acting as Bob for cross-platform tests.
+
+    Connects to the signaling server, auto-accepts pair requests.
+    Tests use headless_bob.pairing_code to pair Alice (app) with Bob.
+    """
+    bob = _start_headless_bob()
     yield bob
     bob.disconnect()
+
+
+@pytest.fixture(scope="class")
+def headless_paired(request):
+    """Alice paired with a headless Bob, shared by a test class.
+
+    Yields (alice_helper, headless_bob) with Alice on the home screen.
+    Pairing and the WebRTC handshake run once per class, and Bob
+    disconnects when the class is done; tests may navigate but must not
+    disconnect either side.
+    """
+    bob = _start_headless_bob()
+    linux_helper = None
+    try:
+        if PLATFORM == "android":
+            _require_appium()
+            driver = get_session_driver(0, "alice")
+            _active_drivers["alice"] = driver
+            helper = _helper_for(driver)
+        elif PLATFORM == "linux":
+            if os.path.exists(DATA_DIR_1):
+                shutil.rmtree(DATA_DIR_1)
+            helper = linux_helper = create_helper(
+                "linux", app_path=APP_PATH, data_dir=DATA_DIR_1, name="alice"
+            )
+            helper.launch()
+        else:
+            helper = request.getfixturevalue("windows_app_session")
+            helper.launch()
+            helper.reset_to_home()
+        helper.wait_for_app_ready()
+
+        helper.navigate_to_connect()
+        helper.get_pairing_code_from_connect_screen()
+        helper.enter_peer_code(bob.pairing_code)
+
+        # Wait for pairing and WebRTC connection
+        helper.go_back_to_home()
+        assert wait_until(helper.is_peer_connected, timeout=P2P_CONNECTION_TIMEOUT + 3), \
+            "Pairing with headless client must succeed"
+        yield helper, bob
+    finally:
+        _active_drivers.pop("alice", None)
+        if linux_helper is not None:
+            linux_helper.stop()
+        bob.disconnect()
+
+
+@pytest.fixture(scope="class")
+def headless_chat(headless_paired):
+    """headless_paired with the chat open, shared by a test class.
+
+    Returns (alice_helper, headless_bob). Tests only exchange messages in
+    the open chat, so they must not navigate away.
+    """
+    helper, bob = headless_paired
+    helper.open_chat_with_peer()
+    if PLATFORM == "android":
+        # The send button is part of the chat screen's input row
+        helper.by_id("send_button", timeout=10)
+    return helper, bob
+
+
+@pytest.fixture(autouse=True)
+def _drain_headless_bob(request):
+    """Start each test on a class-shared headless Bob with an empty inbox.
+
+    A failed or sloppy test can leave messages queued, and the next test's
+    receive_message() would pick them up instead of its own.
+    """
+    if "headless_paired" in request.fixturenames:
+        _, bob = request.getfixturevalue("headless_paired")
+        bob.drain_messages()
+
+
+# ── Headless Protocol Fixtures ───────────────────────────────────
+
+@pytest.fixture(scope="session")
+def _session_loop():
+    """Create one event loop shared by all headless protocol tests.
+
+    Each test opens and closes its own clients inside run(), so nothing
+    is left on the loop between tests.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def run(_session_loop):
+    """Helper to run async code in the shared event loop."""
+    return _session_loop.run_until_complete
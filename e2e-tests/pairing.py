@@ -0,0 +1,49 @@
+"""
+Device pairing for E2E tests.
+
+pair_devices() is the one implementation of "pair Alice and Bob through
+the Connect screen"; the paired_devices fixtures and the tests that need
+a pairing of their own all go through it, so changes to how pairing is
+driven or detected land in one place.
+"""
+
+from config import P2P_CONNECTION_TIMEOUT
+from polling import run_concurrently, wait_until
+
+
+def pair_devices(alice_helper, bob_helper, timeout=None) -> bool:
+    """Pair Alice and Bob through the Connect screen (Android only).
+
+    Alice shows her code, Bob enters it, then both return home and are
+    polled until either side lists the peer as connected.
+
+    Args:
+        alice_helper: AppHelper for the device that shows its code.
+        bob_helper: AppHelper for the device that enters it.
+        timeout: Seconds to wait for the connection. Defaults to six
+            rounds of P2P_CONNECTION_TIMEOUT (TURN relay can be slow).
+
+    Returns:
+        True if either device shows the peer as connected, else False.
+        Both devices are left on the home screen.
+    """
+    if timeout is None:
+        timeout = 6 * (P2P_CONNECTION_TIMEOUT + 3)
+
+    # The two devices are separate Appium sessions, so every step that does
+    # not depend on the other side runs on both at once.
+    run_concurrently(alice_helper.wait_for_app_ready, bob_helper.wait_for_app_ready)
+
+    def _alice_code():
+        alice_helper.navigate_to_connect()
+        return alice_helper.get_pairing_code_from_connect_screen()
+
+    alice_code, _ = run_concurrently(_alice_code, bob_helper.navigate_to_connect)
+    bob_helper.enter_peer_code(alice_code)
+
+    # The status is read from the home screen, so go there once and poll
+    run_concurrently(alice_helper.go_back_to_home, bob_helper.go_back_to_home)
+    return bool(wait_until(
+        lambda: alice_helper.is_peer_connected() or bob_helper.is_peer_connected(),
+        timeout=timeout,
+    ))
@@ -3,6 +3,9 @@ E2E Test Configuration
 
 Environment variables:
 - APPIUM_SERVER_COUNT: Number of Appium servers available
+- APPIUM_SERVERS_PER_WORKER: Servers owned by each pytest-xdist worker
+  (default: all of them, i.e. no sharding). With ``pytest -n 2`` and four
+  servers, set this to 2: gw0 drives servers 0-1, gw1 drives servers 2-3.
 - APK_PATH: Path to the APK on Appium servers (default: /tmp/zajel-test.apk)
 - SIGNALING_URL: WebSocket URL for the signaling server (headless client tests)
 """
@@ -12,6 +15,14 @@ import os
 # Appium configuration
 APPIUM_PORT = 4723
 SERVER_COUNT = int(os.environ.get("APPIUM_SERVER_COUNT", "2"))
+SERVERS_PER_WORKER = int(
+    os.environ.get("APPIUM_SERVERS_PER_WORKER", str(SERVER_COUNT))
+)
+
+# Base ports for the per-device UiAutomator2 and MJPEG servers; offset by
+# the global server index so parallel sessions never share a host port.
+SYSTEM_PORT_BASE = 8200
+MJPEG_SERVER_PORT_BASE = 7810
 APK_PATH = os.environ.get("APK_PATH", "/tmp/zajel-test.apk")
 
 # Signaling server for headless client tests
@@ -20,6 +31,9 @@ SIGNALING_URL = os.environ.get("SIGNALING_URL", "ws://localhost:8080/ws")
 # Timeouts (in seconds)
 APP_LAUNCH_TIMEOUT = 60
 ELEMENT_WAIT_TIMEOUT = 10
+# Appium implicit wait set on every session; AppHelper restores it after
+# zero-wait probes
+IMPLICIT_WAIT = 5
 CONNECTION_TIMEOUT = 30
 P2P_CONNECTION_TIMEOUT = 15
 CALL_CONNECT_TIMEOUT = 30
@@ -32,18 +46,42 @@ ADB_PATH = os.environ.get(
 )
 
 
+def get_worker_index() -> int:
+    """Return the pytest-xdist worker number (gw3 -> 3), or 0 without xdist."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+    if worker.startswith("gw"):
+        return int(worker[2:])
+    return 0
+
+
+def get_global_index(index: int) -> int:
+    """Map a worker-local device index (0 = alice, 1 = bob, ...) to a server index.
+
+    Each xdist worker owns a contiguous block of SERVERS_PER_WORKER servers
+    (and their emulators), so workers never drive the same device.
+    """
+    if index >= SERVERS_PER_WORKER:
+        raise ValueError(
+            f"Device index {index} exceeds servers per worker ({SERVERS_PER_WORKER})"
+        )
+    global_index = get_worker_index() * SERVERS_PER_WORKER + index
+    if global_index >= SERVER_COUNT:
+        raise ValueError(
+            f"Server index {global_index} exceeds available servers ({SERVER_COUNT})"
+        )
+    return global_index
+
+
 def get_server_url(index: int) -> str:
-    """Get Appium server URL for given index (0-based).
+    """Get Appium server URL for given worker-local index (0-based).
 
     When using SSH tunnels, servers are on localhost with incrementing ports.
     Note: Appium 2.x+ uses base path '/' instead of '/wd/hub'
     """
-    if index >= SERVER_COUNT:
-        raise ValueError(f"Server index {index} exceeds available servers ({SERVER_COUNT})")
-    port = APPIUM_PORT + index
+    port = APPIUM_PORT + get_global_index(index)
     return f"http://localhost:{port}"
 
 
 def get_all_servers() -> list[str]:
-    """Get all available Appium server URLs."""
-    return [get_server_url(i) for i in range(SERVER_COUNT)]
+    """Get the Appium server URLs owned by this worker."""
+    return [get_server_url(i) for i in range(SERVERS_PER_WORKER)]
@@ -7,6 +7,21 @@ that interacts with the Zajel Flutter app via Appium + UiAutomator2.
 
 from __future__ import annotations
 
+import time
+import xml.etree.ElementTree as ET
+
+try:
+    from appium.webdriver.common.appiumby import AppiumBy
+    from selenium.common.exceptions import NoSuchElementException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+    APPIUM_AVAILABLE = True
+except ImportError:
+    APPIUM_AVAILABLE = False
+
+from platforms.android_config import IMPLICIT_WAIT
+
 
 class AppHelper:
     """Helper methods for interacting with the Zajel app.
@@ -20,12 +35,39 @@ class AppHelper:
     - Settings screen (/settings): profile, privacy, connection info
     """
 
+    # Text fields are matched with a UiSelector class query, which
+    # UiAutomator2 resolves natively instead of evaluating an XPath over the
+    # whole tree. "-android uiautomator" is AppiumBy.ANDROID_UIAUTOMATOR.
+    EDIT_TEXT = (
+        "-android uiautomator",
+        'new UiSelector().className("android.widget.EditText")',
+    )
+
+    # The "Connected Peers" header is only shown on the home screen, and is
+    # shown whether or not there are peers.
+    HOME_SCREEN = (
+        "xpath",
+        "//*[@package='com.zajel.zajel' and "
+        "contains(@content-desc, 'Connected Peers')]",
+    )
+
+    # Contacts are labelled with the peer's name, which is "Peer ..." or
+    # "Anonymous ..." until an alias is set.
+    CONTACT_TILE = (
+        "-android uiautomator",
+        'new UiSelector().descriptionMatches("(?s).*(Peer|Anonymous).*")',
+    )
+
     def __init__(self, driver):
+        if not APPIUM_AVAILABLE:
+            raise RuntimeError(
+                "Appium client not available. Install with: "
+                "pip install Appium-Python-Client"
+            )
         self.driver = driver
 
     def _dismiss_system_dialog(self):
         """Dismiss 'System UI isn't responding' or similar ANR dialogs."""
-        from selenium.common.exceptions import NoSuchElementException
         try:
             wait_btn = self.driver.find_element(
                 "id", "android:id/aerr_wait"
@@ -43,14 +85,16 @@ class AppHelper:
         2. Wait for the actual home screen content -- the "Zajel" title or
            "Connect" FAB -- not just any android.view.View (which also
            matches the loading spinner shown during initialization).
+
+        Returns straight away if the home screen is already showing, so
+        calling it again on a ready app (or before each step of a shared
+        fixture) costs one lookup instead of the full start-up wait.
         """
-        import time as _time
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
+        if self._on_home_screen():
+            return
 
         # Brief wait for app process to start
-        _time.sleep(3)
+        time.sleep(3)
 
         # Log current app state for CI debugging
         try:
@@ -75,7 +119,7 @@ class AppHelper:
         except Exception:
             # Try dismissing dialog again and retry once
             self._dismiss_system_dialog()
-            _time.sleep(3)
+            time.sleep(3)
             try:
                 WebDriverWait(self.driver, timeout).until(
                     EC.presence_of_element_located((By.XPATH, home_screen_xpath))
@@ -93,13 +137,24 @@ class AppHelper:
         # Dismiss onboarding screen if present (first launch after pm clear)
         self._dismiss_onboarding()
 
+    def _on_home_screen(self) -> bool:
+        """Whether the home screen is showing right now, without waiting.
+
+        The session's implicit wait is suspended for the lookup: with it, a
+        miss would stall for the whole implicit timeout. It is restored to
+        IMPLICIT_WAIT, the value conftest sets on every session.
+        """
+        try:
+            self.driver.implicitly_wait(0)
+            try:
+                return bool(self.driver.find_elements(*self.HOME_SCREEN))
+            finally:
+                self.driver.implicitly_wait(IMPLICIT_WAIT)
+        except Exception:
+            return False
+
     def _dismiss_onboarding(self):
         """Dismiss the onboarding screen if present (first launch after pm clear)."""
-        import time as _time
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
-
         try:
             skip_btn = self.driver.find_element(
                 By.XPATH,
@@ -108,7 +163,7 @@ class AppHelper:
             )
             print("[wait_for_app_ready] Onboarding screen detected, tapping Skip")
             skip_btn.click()
-            _time.sleep(2)
+            time.sleep(2)
             # Re-wait for the actual home screen after onboarding dismissal
             home_screen_xpath = (
                 "//*[@package='com.zajel.zajel' and "
@@ -124,6 +179,21 @@ class AppHelper:
         except Exception:
             pass  # No onboarding screen -- already on home
 
+    @staticmethod
+    def _text_xpath(text, partial=True):
+        """Build the XPath used to match text in @text, @content-desc or @tooltip-text."""
+        if partial:
+            return (
+                f"//*[contains(@text, '{text}') or "
+                f"contains(@content-desc, '{text}') or "
+                f"contains(@tooltip-text, '{text}')]"
+            )
+        return (
+            f"//*[@text='{text}' or "
+            f"@content-desc='{text}' or "
+            f"@tooltip-text='{text}']"
+        )
+
     def _find(self, text, timeout=10, partial=True):
         """Find an element by text, checking @text, @content-desc, and @tooltip-text.
 
@@ -132,22 +202,7 @@ class AppHelper:
         configuration. In release builds on Android 12+ (API 31), IconButton
         tooltips appear as @tooltip-text rather than @content-desc.
         """
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
-
-        if partial:
-            xpath = (
-                f"//*[contains(@text, '{text}') or "
-                f"contains(@content-desc, '{text}') or "
-                f"contains(@tooltip-text, '{text}')]"
-            )
-        else:
-            xpath = (
-                f"//*[@text='{text}' or "
-                f"@content-desc='{text}' or "
-                f"@tooltip-text='{text}']"
-            )
+        xpath = self._text_xpath(text, partial)
 
         try:
             return WebDriverWait(self.driver, timeout).until(
@@ -164,51 +219,142 @@ class AppHelper:
             print("=== END PAGE SOURCE ===")
             raise
 
+    def by_id(self, identifier, timeout=10):
+        """Find an element by its Flutter Semantics identifier.
+
+        Flutter exposes ``Semantics(identifier: ...)`` as the Android
+        resource-id, so the lookup goes through a UiSelector instead of
+        evaluating a text XPath over the whole tree. The identifier is used
+        verbatim (no package prefix), which is why By.ID is not used.
+        """
+        return WebDriverWait(self.driver, timeout).until(
+            EC.presence_of_element_located((
+                AppiumBy.ANDROID_UIAUTOMATOR,
+                f'new UiSelector().resourceId("{identifier}")',
+            ))
+        )
+
+    def wait_for(self, locator, timeout=10):
+        """Wait for an element matching a (by, value) locator.
+
+        For the class locators (EDIT_TEXT, CONTACT_TILE, ...), so the wait
+        is explicit instead of riding on the session's implicit wait.
+
+        Raises:
+            selenium.common.exceptions.TimeoutException: If nothing matches
+                within ``timeout`` seconds.
+        """
+        return WebDriverWait(self.driver, timeout).until(
+            EC.presence_of_element_located(locator)
+        )
+
+    def wait_until_visible(self, text, timeout=10, partial=True):
+        """Wait for an element with the given text instead of sleeping.
+
+        Use after a tap as the synchronization point for the next screen
+        or dialog. Unlike _find, a timeout does not dump the page source.
+
+        Returns:
+            The first matching element.
+
+        Raises:
+            selenium.common.exceptions.TimeoutException: If nothing matches
+                within ``timeout`` seconds.
+        """
+        xpath = self._text_xpath(text, partial)
+        return WebDriverWait(self.driver, timeout).until(
+            lambda d: d.find_elements(By.XPATH, xpath)
+        )[0]
+
+    def assert_all_visible(self, *labels, timeout=10):
+        """Assert that every label is on screen, with one query per poll.
+
+        Fetches the page source once per poll and checks all labels against
+        @text, @content-desc and @tooltip-text (substring match, like
+        _find), instead of one full XPath lookup per label.
+
+        Raises:
+            AssertionError: Listing the labels still missing at timeout.
+        """
+        missing = list(labels)
+        deadline = time.time() + timeout
+        while True:
+            try:
+                root = ET.fromstring(self.driver.page_source)
+                values = [
+                    value
+                    for node in root.iter()
+                    for key, value in node.attrib.items()
+                    if key in ("text", "content-desc", "tooltip-text") and value
+                ]
+                missing = [
+                    label for label in labels
+                    if not any(label in value for value in values)
+                ]
+            except Exception as e:
+                print(f"[assert_all_visible] page source unavailable: {e}")
+            if not missing or time.time() >= deadline:
+                break
+            time.sleep(0.5)
+
+        assert not missing, f"Not visible within {timeout}s: {missing}"
+
+    def _type_in_field(self, text, field=None, timeout=10):
+        """Set a text field's content in a single command.
+
+        Waits for the first EditText unless ``field`` is given, then sends
+        the text to that element. UiAutomator2 applies it as a set-text
+        accessibility action on the resolved node, so the field needs no
+        tap to take focus first (unlike ``mobile: type``, which types into
+        whatever is focused), and any previous content is replaced.
+        """
+        if field is None:
+            field = WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located(self.EDIT_TEXT)
+            )
+        field.send_keys(text)
+        return field
+
     def _scroll_down(self, times=1):
         """Scroll down on the current screen."""
-        import time as _time
         screen_size = self.driver.get_window_size()
         center_x = int(screen_size['width'] * 0.5)
         start_y = int(screen_size['height'] * 0.7)
         end_y = int(screen_size['height'] * 0.3)
         for _ in range(times):
             self.driver.swipe(center_x, start_y, center_x, end_y, 500)
-            _time.sleep(0.5)
+            time.sleep(0.5)
 
     def navigate_to_connect(self):
         """Navigate to the Connect screen by tapping the FAB or QR icon."""
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
-
         try:
-            btn = WebDriverWait(self.driver, 5).until(
-                EC.element_to_be_clickable((
-                    By.XPATH,
-                    "//*[("
-                    "@tooltip-text='Connect to peer' or "
-                    "@content-desc='Connect to peer' or "
-                    "((@content-desc='Connect' or @text='Connect') "
-                    "and not(contains(@content-desc, 'Connected')) "
-                    "and not(contains(@content-desc, 'QR')))"
-                    ") and @clickable='true']"
-                ))
-            )
-            btn.click()
+            self.by_id("connect_button", timeout=5).click()
         except Exception:
-            # Last resort: click "Connect via QR code"
-            self._find("Connect via QR code", timeout=5).click()
+            try:
+                btn = WebDriverWait(self.driver, 5).until(
+                    EC.element_to_be_clickable((
+                        By.XPATH,
+                        "//*[("
+                        "@tooltip-text='Connect to peer' or "
+                        "@content-desc='Connect to peer' or "
+                        "((@content-desc='Connect' or @text='Connect') "
+                        "and not(contains(@content-desc, 'Connected')) "
+                        "and not(contains(@content-desc, 'QR')))"
+                        ") and @clickable='true']"
+                    ))
+                )
+                btn.click()
+            except Exception:
+                # Last resort: click "Connect via QR code"
+                self._find("Connect via QR code", timeout=5).click()
 
         # Wait for Connect screen to load
         self._find("My Code")
 
     def wait_for_signaling_connected(self, timeout: int = 60):
         """Wait until signaling server connects and pairing code appears."""
-        import time as _time
-        from selenium.common.exceptions import NoSuchElementException
-
-        deadline = _time.time() + timeout
-        while _time.time() < deadline:
+        deadline = time.time() + timeout
+        while time.time() < deadline:
             try:
                 el = self.driver.find_element(
                     "xpath",
@@ -219,7 +365,7 @@ class AppHelper:
                     return
             except NoSuchElementException:
                 pass
-            _time.sleep(2)
+            time.sleep(2)
 
         raise TimeoutError("Signaling server did not connect within timeout")
 
@@ -234,10 +380,6 @@ class AppHelper:
 
     def get_pairing_code_from_connect_screen(self) -> str:
         """Get the pairing code from the Connect screen (large 6-char display)."""
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
-
         xpath = (
             "//*["
             "(string-length(@text) = 6 and translate(@text, 'abcdefghijklmnopqrstuvwxyz', 'ABCDEFGHIJKLMNOPQRSTUVWXYZ') = @text)"
@@ -252,11 +394,6 @@ class AppHelper:
 
     def enter_peer_code(self, code: str):
         """Enter a peer's pairing code on the Connect screen and submit."""
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
-        import time
-
         screen_size = self.driver.get_window_size()
         start_y = int(screen_size['height'] * 0.8)
         end_y = int(screen_size['height'] * 0.2)
@@ -265,7 +402,7 @@ class AppHelper:
         for attempt in range(3):
             try:
                 input_field = WebDriverWait(self.driver, 5).until(
-                    EC.presence_of_element_located((By.XPATH, "//android.widget.EditText"))
+                    EC.presence_of_element_located(self.EDIT_TEXT)
                 )
                 break
             except Exception:
@@ -273,11 +410,10 @@ class AppHelper:
                 time.sleep(1)
         else:
             input_field = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//android.widget.EditText"))
+                EC.presence_of_element_located(self.EDIT_TEXT)
             )
 
-        input_field.click()
-        self.driver.execute_script('mobile: type', {'text': code})
+        self._type_in_field(code, field=input_field)
 
         connect_btn = WebDriverWait(self.driver, 5).until(
             EC.element_to_be_clickable((
@@ -287,26 +423,25 @@ class AppHelper:
         )
         connect_btn.click()
 
-    def go_back_to_home(self):
-        """Navigate back to the home screen."""
-        from selenium.common.exceptions import NoSuchElementException
-        try:
-            self.driver.find_element(
-                "xpath",
-                "//*[@package='com.zajel.zajel' and "
-                "contains(@content-desc, 'Connected Peers')]"
-            )
-            return
-        except (NoSuchElementException, Exception):
-            pass
-        self.driver.back()
+    def go_back_to_home(self, max_backs: int = 3):
+        """Navigate back to the home screen.
+
+        Presses back until the home screen shows, at most ``max_backs``
+        times, so nested screens (Settings > Audio & Video) work too.
+        Each check polls with zero-wait probes for up to a second, which
+        still gives a screen transition time to land, so back is never
+        pressed on the home screen itself (that would leave the app).
+        """
+        for _ in range(max_backs):
+            deadline = time.monotonic() + 1
+            while time.monotonic() < deadline:
+                if self._on_home_screen():
+                    return
+                time.sleep(0.2)
+            self.driver.back()
 
     def open_chat_with_peer(self, peer_name: str = None):
         """Tap on a connected peer to open the chat screen."""
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
-
         if peer_name:
             xpath = (
                 f"//*[contains(@content-desc, '{peer_name}') and "
@@ -324,36 +459,19 @@ class AppHelper:
 
     def send_message(self, text: str):
         """Type and send a message in the chat screen."""
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
-
-        input_field = WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, "//android.widget.EditText"))
-        )
-        input_field.click()
-        self.driver.execute_script('mobile: type', {'text': text})
-
-        send_btn = WebDriverWait(self.driver, 5).until(
-            EC.element_to_be_clickable((
-                By.XPATH,
-                "//*[contains(@content-desc, 'Send message') or "
-                "contains(@content-desc, 'Send')]"
-            ))
-        )
-        send_btn.click()
+        self._type_in_field(text)
+        self.by_id("send_button", timeout=5).click()
 
-    def has_message(self, text: str) -> bool:
+    def has_message(self, text: str, timeout: float = 5) -> bool:
         """Check if a message with the given text is visible."""
         try:
-            self._find(text, timeout=5)
+            self._find(text, timeout=timeout)
             return True
         except Exception:
             return False
 
     def is_peer_connected(self, peer_name: str = None) -> bool:
         """Check if a peer shows as 'Connected' on the home screen."""
-        from selenium.common.exceptions import NoSuchElementException
         try:
             if peer_name:
                 self.driver.find_element(
@@ -371,7 +489,6 @@ class AppHelper:
 
     def is_status_online(self) -> bool:
         """Check if the signaling status shows 'Online'."""
-        from selenium.common.exceptions import NoSuchElementException
         try:
             self.driver.find_element(
                 "xpath", "//*[@text='Online' or @content-desc='Online']"
@@ -423,22 +540,26 @@ class AppHelper:
         self._find("Decline", timeout=15, partial=False).click()
 
     def has_incoming_call_dialog(self, timeout: int = 15) -> bool:
-        """Check if an incoming call dialog is visible."""
-        import time as _time
-        deadline = _time.time() + timeout
-        while _time.time() < deadline:
-            try:
-                self._find("Incoming", timeout=2)
-                return True
-            except Exception:
-                pass
-            try:
-                self._find("Decline", timeout=1, partial=False)
-                return True
-            except Exception:
-                pass
-            _time.sleep(1)
-        return False
+        """Check if an incoming call dialog is visible.
+
+        Waits on one XPath matching either the "Incoming" title or the
+        "Decline" button, so the dialog is detected as soon as either
+        renders instead of alternating two separate lookups.
+        """
+        xpath = (
+            "//*[contains(@text, 'Incoming') or "
+            "contains(@content-desc, 'Incoming') or "
+            "contains(@tooltip-text, 'Incoming') or "
+            "@text='Decline' or @content-desc='Decline' or "
+            "@tooltip-text='Decline']"
+        )
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((By.XPATH, xpath))
+            )
+            return True
+        except Exception:
+            return False
 
     def end_call(self):
         """Tap 'End' button to hang up."""
@@ -446,69 +567,48 @@ class AppHelper:
 
     def wait_for_call_connected(self, timeout: int = 30) -> bool:
         """Wait until call shows a duration timer ('00:'), indicating connected."""
-        import time as _time
-        deadline = _time.time() + timeout
-        while _time.time() < deadline:
+        deadline = time.time() + timeout
+        while time.time() < deadline:
             try:
                 self._find('00:', timeout=2)
                 return True
             except Exception:
-                _time.sleep(1)
+                time.sleep(1)
         return False
 
     # -- Settings helpers --
 
     def navigate_to_settings(self):
-        """Tap 'Settings' tooltip button from home screen app bar."""
-        self._find("Settings", timeout=10).click()
-        import time as _time
-        _time.sleep(1)
+        """Tap 'Settings' button from home screen app bar."""
+        self.by_id("settings_button", timeout=10).click()
+        time.sleep(1)
 
     def change_display_name(self, name: str):
         """In settings, tap display name row, clear field, type new name, save."""
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
-
         self._find("Tap to change display name", timeout=10).click()
-        import time as _time
-        _time.sleep(1)
-
-        input_field = WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, "//android.widget.EditText"))
-        )
-        input_field.clear()
-        self.driver.execute_script('mobile: type', {'text': name})
-
+        self._type_in_field(name)
         self._find("Save", timeout=5, partial=False).click()
-        _time.sleep(1)
+        time.sleep(1)
 
     def tap_settings_option(self, text: str):
         """Tap a settings row by its title text."""
         self._find(text, timeout=10).click()
-        import time as _time
-        _time.sleep(1)
+        time.sleep(1)
 
     def confirm_dialog(self, button_text: str):
         """Tap a button in an alert dialog."""
         self._find(button_text, timeout=10, partial=False).click()
-        import time as _time
-        _time.sleep(1)
+        time.sleep(1)
 
     def dismiss_dialog(self):
         """Tap 'Cancel' in an alert dialog."""
         self._find("Cancel", timeout=10, partial=False).click()
-        import time as _time
-        _time.sleep(1)
+        time.sleep(1)
 
     # -- Peer management helpers --
 
     def open_peer_menu(self):
         """Tap the overflow menu (more_vert) on the first visible peer card."""
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
-
         menu_btn = WebDriverWait(self.driver, 10).until(
             EC.presence_of_element_located((
                 By.XPATH,
@@ -517,14 +617,12 @@ class AppHelper:
             ))
         )
         menu_btn.click()
-        import time as _time
-        _time.sleep(1)
+        time.sleep(1)
 
     def tap_menu_option(self, option: str):
         """Tap a popup menu item by text."""
         self._find(option, timeout=10).click()
-        import time as _time
-        _time.sleep(1)
+        time.sleep(1)
 
     # -- Notification settings helpers --
 
@@ -558,65 +656,45 @@ class AppHelper:
     def open_emoji_picker(self):
         """Tap the emoji button in the chat input bar."""
         self._find("Emoji", timeout=10).click()
-        import time as _time
-        _time.sleep(1)
+        time.sleep(1)
 
     def close_emoji_picker(self):
         """Tap the keyboard button to close the emoji picker."""
         self._find("Keyboard", timeout=10).click()
-        import time as _time
-        _time.sleep(1)
+        time.sleep(1)
 
     # -- Contact helpers --
 
     def navigate_to_contacts(self):
         """Tap the contacts button from home screen."""
-        self._find("Contacts", timeout=10).click()
-        import time as _time
-        _time.sleep(1)
+        self.by_id("contacts_button", timeout=10).click()
+        time.sleep(1)
 
     def set_peer_alias(self, alias: str):
         """In contact detail, set a custom alias."""
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
-
         self._find("Edit alias", timeout=10).click()
-        import time as _time
-        _time.sleep(1)
-
-        input_field = WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, "//android.widget.EditText"))
-        )
-        input_field.clear()
-        self.driver.execute_script('mobile: type', {'text': alias})
-
+        self._type_in_field(alias)
         self._find("Save", timeout=5, partial=False).click()
-        _time.sleep(1)
+        time.sleep(1)
 
     def search_contacts(self, query: str):
         """Type in the contacts search bar."""
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
+        self._type_in_field(query)
 
-        search_field = WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, "//android.widget.EditText"))
-        )
-        search_field.click()
-        self.driver.execute_script('mobile: type', {'text': query})
+    def open_first_contact(self):
+        """Tap the first (unaliased) contact to open its detail screen."""
+        self.wait_for(self.CONTACT_TILE).click()
+        time.sleep(1)
 
     def open_contact_detail(self, name: str):
         """Tap a contact in the contacts list to open detail."""
         self._find(name, timeout=10).click()
-        import time as _time
-        _time.sleep(1)
+        time.sleep(1)
 
     # -- Offline peer helpers --
 
     def is_peer_offline(self, peer_name: str = None) -> bool:
         """Check if a peer shows as 'Offline' on the home screen."""
-        from selenium.common.exceptions import NoSuchElementException
         try:
             if peer_name:
                 self.driver.find_element(
@@ -665,11 +743,6 @@ class AppHelper:
     def remove_peer_permanently(self, peer_name: str):
         """Remove a peer permanently from blocked list via popup menu."""
         self._find(peer_name, timeout=10)
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
-        import time as _time
-
         menu = WebDriverWait(self.driver, 10).until(
             EC.presence_of_element_located((
                 By.XPATH,
@@ -679,22 +752,14 @@ class AppHelper:
             ))
         )
         menu.click()
-        _time.sleep(1)
-
-        self._find("Remove Permanently", timeout=10).click()
-        _time.sleep(1)
-
-        self._find("Remove", timeout=10, partial=False).click()
-        _time.sleep(1)
+        self.wait_until_visible("Remove Permanently").click()
+        self.wait_until_visible("Remove", partial=False).click()
+        time.sleep(1)
 
     # -- File transfer helpers --
 
     def tap_attach_file(self):
         """Tap the attach file button in chat input bar."""
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
-
         attach_btn = WebDriverWait(self.driver, 10).until(
             EC.presence_of_element_located((
                 By.XPATH,
@@ -706,11 +771,6 @@ class AppHelper:
 
     def select_file_in_picker(self, filename: str, timeout: int = 10) -> bool:
         """Select a file in the Android Documents UI file picker."""
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
-        import time as _time
-
         try:
             file_elem = WebDriverWait(self.driver, timeout).until(
                 EC.presence_of_element_located((
@@ -719,7 +779,7 @@ class AppHelper:
                 ))
             )
             file_elem.click()
-            _time.sleep(2)
+            time.sleep(2)
             return True
         except Exception:
             try:
@@ -728,14 +788,14 @@ class AppHelper:
                     "//*[@content-desc='Show roots']"
                 )
                 roots_btn.click()
-                _time.sleep(1)
+                time.sleep(1)
 
                 downloads = self.driver.find_element(
                     By.XPATH,
                     "//*[contains(@text, 'Downloads')]"
                 )
                 downloads.click()
-                _time.sleep(2)
+                time.sleep(2)
 
                 file_elem = WebDriverWait(self.driver, timeout).until(
                     EC.presence_of_element_located((
@@ -744,7 +804,7 @@ class AppHelper:
                     ))
                 )
                 file_elem.click()
-                _time.sleep(2)
+                time.sleep(2)
                 return True
             except Exception:
                 return False
@@ -343,10 +343,10 @@ class LinuxAppHelper:
         self.type_text(text)
         self.click("Send message")
 
-    def has_message(self, text: str) -> bool:
+    def has_message(self, text: str, timeout: float = 5) -> bool:
         """Check if a message is visible in chat."""
         try:
-            self.find_by_name(text, timeout=5)
+            self.find_by_name(text, timeout=timeout)
             return True
         except (TimeoutError, Exception):
             return False
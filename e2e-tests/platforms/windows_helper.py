@@ -12,17 +12,22 @@ Key concepts:
 - Elements are found by title (Name), control_type, or automation_id
 """
 
+import operator
 import time
 
 try:
     from pywinauto import Application, Desktop
     from pywinauto.timings import wait_until
+    from pywinauto.timings import TimeoutError as WaitUntilTimeout
     PYWINAUTO_AVAILABLE = True
 except ImportError:
     PYWINAUTO_AVAILABLE = False
 
 from platforms.windows_config import APP_LAUNCH_TIMEOUT, ELEMENT_WAIT_TIMEOUT
 
+# Interval between UIA probes in all polling waits below.
+RETRY_INTERVAL = 0.2
+
 
 class WindowsAppHelper:
     """Helper for interacting with the Zajel Flutter app on Windows via UIA.
@@ -51,7 +56,14 @@ class WindowsAppHelper:
 
         Passes --enable-software-rendering to avoid ANGLE/DirectX failures
         on CI runners that lack GPU hardware or have driver issues.
+
+        Idempotent: if the process started by this helper is still running,
+        the existing connection is reused instead of paying another Flutter
+        cold start.
         """
+        if self.app is not None and self.app.is_process_running():
+            return
+
         self.app = Application(backend="uia").start(
             f'"{self.app_path}" --enable-software-rendering',
             timeout=timeout,
@@ -75,6 +87,24 @@ class WindowsAppHelper:
             self.app = None
             self.main_window = None
 
+    def _wait_for(self, probe, timeout: float, message: str):
+        """Poll ``probe`` via pywinauto's wait_until until it returns non-None.
+
+        Args:
+            probe: Zero-argument callable returning the found value or None.
+            timeout: Maximum seconds to wait.
+            message: Message for the TimeoutError raised on expiry.
+
+        Returns:
+            The first non-None value returned by ``probe``.
+        """
+        try:
+            return wait_until(
+                timeout, RETRY_INTERVAL, probe, None, operator.is_not
+            )
+        except WaitUntilTimeout:
+            raise TimeoutError(message) from None
+
     def find_by_name(self, name: str, timeout: int = ELEMENT_WAIT_TIMEOUT):
         """Find a widget by its UIA Name property (Semantics label).
 
@@ -85,35 +115,53 @@ class WindowsAppHelper:
         Returns:
             The UIA element matching the name.
         """
-        deadline = time.time() + timeout
-        while time.time() < deadline:
+        def _probe():
             try:
                 element = self.main_window.child_window(
                     title=name, found_index=0
                 )
-                if element.exists(timeout=0.5):
+                if element.exists(timeout=0):
                     return element
             except Exception:
                 pass
-            time.sleep(0.5)
+            return None
+
+        return self._wait_for(
+            _probe, timeout, f"Element '{name}' not found within {timeout}s"
+        )
+
+    def find_by_name_contains(self, text: str, timeout: int = ELEMENT_WAIT_TIMEOUT,
+                              control_type: str = None):
+        """Find a widget whose UIA Name contains the given text.
 
-        raise TimeoutError(f"Element '{name}' not found within {timeout}s")
+        Matches with a plain substring check rather than a ``title_re``
+        regex, so message text containing regex metacharacters is matched
+        literally and no pattern is compiled per candidate.
 
-    def find_by_name_contains(self, text: str, timeout: int = ELEMENT_WAIT_TIMEOUT):
-        """Find a widget whose UIA Name contains the given text."""
-        deadline = time.time() + timeout
-        while time.time() < deadline:
+        Args:
+            text: Substring to look for in the UIA Name property.
+            timeout: Maximum seconds to wait for the element.
+            control_type: Optional UIA control type (e.g. "Text") used to
+                narrow the candidates UIA returns before names are compared.
+        """
+        criteria = {"control_type": control_type} if control_type else {}
+
+        def _probe():
             try:
-                element = self.main_window.child_window(
-                    title_re=f".*{text}.*", found_index=0
-                )
-                if element.exists(timeout=0.5):
-                    return element
+                for element in self.main_window.descendants(**criteria):
+                    try:
+                        if text in element.window_text():
+                            return element
+                    except Exception:
+                        continue
             except Exception:
                 pass
-            time.sleep(0.5)
+            return None
 
-        raise TimeoutError(f"Element containing '{text}' not found within {timeout}s")
+        return self._wait_for(
+            _probe, timeout,
+            f"Element containing '{text}' not found within {timeout}s",
+        )
 
     def click(self, name: str, timeout: int = ELEMENT_WAIT_TIMEOUT):
         """Find and click an element by name."""
@@ -135,6 +183,20 @@ class WindowsAppHelper:
         """Wait for the home screen to be visible."""
         self.find_by_name("Zajel", timeout)
 
+    def reset_to_home(self, max_presses: int = 5, timeout: int = APP_LAUNCH_TIMEOUT):
+        """Return a reused app instance to the home screen.
+
+        Presses Escape until the "Zajel" home title is visible, so a
+        long-lived process can be handed to the next test without a restart.
+        """
+        for _ in range(max_presses):
+            try:
+                self.find_by_name("Zajel", timeout=1)
+                return
+            except TimeoutError:
+                self.press_key("{ESCAPE}")
+        self.wait_for_app_ready(timeout)
+
     # ── Navigation ────────────────────────────────────────────────
 
     def navigate_to_connect(self):
@@ -156,11 +218,12 @@ class WindowsAppHelper:
 
     def get_pairing_code_from_connect_screen(self) -> str:
         """Get the pairing code displayed on the Connect screen."""
-        deadline = time.time() + 30
-        while time.time() < deadline:
+        def _probe():
             try:
-                # Look for children that match a 6-char alphanumeric code
-                children = self.main_window.descendants()
+                # Only enumerate Text nodes (the code is a static label),
+                # mirroring the label-role search in LinuxAppHelper. This
+                # keeps each retry far cheaper than a full-tree walk.
+                children = self.main_window.descendants(control_type="Text")
                 for child in children:
                     try:
                         name = child.window_text()
@@ -170,8 +233,11 @@ class WindowsAppHelper:
                         continue
             except Exception:
                 pass
-            time.sleep(1)
-        raise TimeoutError("Pairing code not found on Connect screen")
+            return None
+
+        return self._wait_for(
+            _probe, 30, "Pairing code not found on Connect screen"
+        )
 
     def enter_peer_code(self, code: str):
         """Enter a peer's pairing code and submit."""
@@ -189,7 +255,7 @@ class WindowsAppHelper:
 
     def wait_for_signaling_connected(self, timeout: int = 60):
         """Wait for signaling server connection."""
-        self.find_by_name_contains("Code:", timeout)
+        self.find_by_name_contains("Code:", timeout, control_type="Text")
 
     # ── Peer state ───────────────────────────────────────────────
 
@@ -222,10 +288,10 @@ class WindowsAppHelper:
             self.type_text(text)
         self.click("Send message")
 
-    def has_message(self, text: str) -> bool:
+    def has_message(self, text: str, timeout: float = 5) -> bool:
         """Check if a message is visible in chat."""
         try:
-            self.find_by_name_contains(text, timeout=5)
+            self.find_by_name_contains(text, timeout=timeout, control_type="Text")
             return True
         except (TimeoutError, Exception):
             return False
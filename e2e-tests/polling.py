@@ -0,0 +1,65 @@
+"""
+Condition polling for E2E tests.
+
+Use wait_until() instead of a fixed time.sleep() when the test is really
+waiting for some state (a peer connecting, a file being indexed): it
+returns as soon as the condition holds, and only pays the full timeout
+when it never does. run_concurrently() overlaps independent waits on
+different devices.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Poll quickly at first -- most conditions are already true or become true
+# within a few hundred milliseconds -- then back off to this ceiling.
+_BACKOFF = (0.1, 0.25)
+
+
+def wait_until(predicate, timeout: float, interval: float = 0.5):
+    """Poll ``predicate`` until it returns a truthy value or time runs out.
+
+    Exceptions raised by the predicate count as "not yet" (UI lookups
+    commonly raise while a screen is still rendering).
+
+    Args:
+        predicate: Zero-argument callable to poll.
+        timeout: Seconds to keep polling.
+        interval: Longest pause between polls; the first polls are shorter.
+
+    Returns:
+        The predicate's truthy result, or False on timeout.
+    """
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    while True:
+        try:
+            result = predicate()
+            if result:
+                return result
+        except Exception:
+            pass
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        pause = _BACKOFF[attempt] if attempt < len(_BACKOFF) else interval
+        time.sleep(min(pause, interval, remaining))
+        attempt += 1
+
+
+def run_concurrently(*calls):
+    """Run zero-argument callables on separate threads and wait for all.
+
+    Meant for the same step on different devices (each has its own Appium
+    session), e.g. ``run_concurrently(alice.wait_for_app_ready,
+    bob.wait_for_app_ready)``.
+
+    Returns:
+        The results, in the order the callables were given.
+
+    Raises:
+        The first exception raised by any call, after all have finished.
+    """
+    with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+        futures = [pool.submit(call) for call in calls]
+    return [future.result() for future in futures]
@@ -3,7 +3,7 @@
 import time
 import pytest
 from platforms.android_helper import AppHelper
-from config import P2P_CONNECTION_TIMEOUT
+from pairing import pair_devices
 
 
 @pytest.mark.blocked_enhanced
@@ -12,26 +12,7 @@ class TestBlockedEnhanced:
 
     def _pair_and_block(self, alice_helper, bob_helper, alice, bob):
         """Pair two devices, then block Bob from Alice."""
-        alice_helper.wait_for_app_ready()
-        bob_helper.wait_for_app_ready()
-
-        alice_helper.navigate_to_connect()
-        alice_code = alice_helper.get_pairing_code_from_connect_screen()
-
-        bob_helper.navigate_to_connect()
-        bob_helper.enter_peer_code(alice_code)
-
-        connected = False
-        for _ in range(6):
-            time.sleep(P2P_CONNECTION_TIMEOUT)
-            alice_helper.go_back_to_home()
-            bob_helper.go_back_to_home()
-            time.sleep(3)
-            if alice_helper.is_peer_connected() or bob_helper.is_peer_connected():
-                connected = True
-                break
-
-        assert connected, "Devices must be paired"
+        assert pair_devices(alice_helper, bob_helper), "Devices must be paired"
 
         # Block Bob from Alice
         alice_helper.go_back_to_home()
@@ -15,7 +15,8 @@ transitions, not audio/video quality.
 import time
 import pytest
 
-from config import P2P_CONNECTION_TIMEOUT, CALL_CONNECT_TIMEOUT
+from config import CALL_CONNECT_TIMEOUT
+from pairing import pair_devices
 
 
 @pytest.mark.calls
@@ -31,29 +32,7 @@ class TestCalls:
         alice = app_helper(alice_driver)
         bob = app_helper(bob_driver)
 
-        alice.wait_for_app_ready()
-        bob.wait_for_app_ready()
-
-        # Alice gets her code from the Connect screen
-        alice.navigate_to_connect()
-        alice_code = alice.get_pairing_code_from_connect_screen()
-
-        # Bob enters Alice's code
-        bob.navigate_to_connect()
-        bob.enter_peer_code(alice_code)
-
-        # Wait for P2P connection with retry (TURN relay can be slow)
-        connected = False
-        for _ in range(6):
-            time.sleep(P2P_CONNECTION_TIMEOUT)
-            alice.go_back_to_home()
-            bob.go_back_to_home()
-            time.sleep(3)
-            if alice.is_peer_connected() or bob.is_peer_connected():
-                connected = True
-                break
-
-        assert connected, "Devices must be paired before call tests"
+        assert pair_devices(alice, bob), "Devices must be paired before call tests"
 
         # Both open the chat screen — give extra time for VoIP service init
         alice.open_chat_with_peer()
@@ -71,7 +50,6 @@ class TestCalls:
 
         # Alice initiates a voice call
         alice.start_voice_call()
-        time.sleep(3)
 
         # Bob should see incoming call dialog
         assert bob.has_incoming_call_dialog(), "Bob should see incoming call"
@@ -94,7 +72,6 @@ class TestCalls:
         )
 
         alice.start_video_call()
-        time.sleep(2)
 
         assert bob.has_incoming_call_dialog(), "Bob should see incoming video call"
 
@@ -114,7 +91,6 @@ class TestCalls:
         )
 
         alice.start_voice_call()
-        time.sleep(2)
 
         assert bob.has_incoming_call_dialog(), "Bob should see incoming call"
 
@@ -135,7 +111,6 @@ class TestCalls:
         )
 
         alice.start_video_call()
-        time.sleep(2)
 
         assert bob.has_incoming_call_dialog(), "Bob should see incoming video call"
 
@@ -155,7 +130,7 @@ class TestCalls:
         )
 
         alice.start_voice_call()
-        time.sleep(2)
+        assert bob.has_incoming_call_dialog(), "Bob should see incoming call"
         bob.accept_incoming_call()
         assert alice.wait_for_call_connected(CALL_CONNECT_TIMEOUT)
 
@@ -192,7 +167,7 @@ class TestCalls:
         )
 
         alice.start_video_call()
-        time.sleep(2)
+        assert bob.has_incoming_call_dialog(), "Bob should see incoming video call"
         bob.accept_incoming_call(with_video=True)
         assert alice.wait_for_call_connected(CALL_CONNECT_TIMEOUT)
 
@@ -228,7 +203,7 @@ class TestCalls:
         )
 
         alice.start_voice_call()
-        time.sleep(2)
+        assert bob.has_incoming_call_dialog(), "Bob should see incoming call"
         bob.accept_incoming_call()
         assert alice.wait_for_call_connected(CALL_CONNECT_TIMEOUT)
 
@@ -246,7 +221,7 @@ class TestCalls:
         )
 
         alice.start_voice_call()
-        time.sleep(2)
+        assert bob.has_incoming_call_dialog(), "Bob should see incoming call"
         bob.accept_incoming_call()
         assert bob.wait_for_call_connected(CALL_CONNECT_TIMEOUT)
 
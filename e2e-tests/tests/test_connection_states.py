@@ -12,6 +12,17 @@ import time
 import pytest
 
 from config import P2P_CONNECTION_TIMEOUT
+from polling import run_concurrently, wait_until
+
+# One connection attempt plus the home screen catching up, the unit the
+# pairing waits use (pair_devices, headless_paired)
+CONNECTION_ROUND = P2P_CONNECTION_TIMEOUT + 3
+# Signaling comes up after navigating to Connect
+ONLINE_TIMEOUT = 2 * CONNECTION_ROUND
+# The peer's data channel has to time out before Alice marks it offline
+DISCONNECT_TIMEOUT = 3 * CONNECTION_ROUND
+# Both apps were just restarted and re-register with signaling first
+RECONNECT_TIMEOUT = 2 * CONNECTION_ROUND
 
 
 @pytest.mark.connection
@@ -27,50 +38,55 @@ class TestConnectionStates:
 
         # Navigate to Connect to trigger signaling server connection
         helper.navigate_to_connect()
-        time.sleep(5)
-
         helper.go_back_to_home()
-        time.sleep(3)
 
-        # Wait for 'Online' status with retries (signaling may take a moment)
-        online = False
-        for _ in range(6):
-            if helper.is_status_online():
-                online = True
-                break
-            time.sleep(5)
+        # Wait for 'Online' status (signaling may take a moment)
+        online = wait_until(helper.is_status_online, timeout=ONLINE_TIMEOUT)
 
         assert online, "App should show 'Online' status after connecting to signaling"
 
     @pytest.mark.slow
-    def test_cancel_connection(self, device_pair, app_helper):
-        """Start connecting to a peer → tap Cancel → peer status reverts."""
-        alice_driver = device_pair["alice"]
-        bob_driver = device_pair["bob"]
+    @pytest.mark.destructive
+    def test_peer_disconnect_updates_status(self, fresh_paired_devices):
+        """Paired → kill Bob's app → Alice sees peer no longer 'Connected'."""
+        alice, bob = fresh_paired_devices
+        bob_driver = bob.driver
 
-        alice = app_helper(alice_driver)
-        bob = app_helper(bob_driver)
+        # Pairing succeeds once either side connects; Alice may lag slightly
+        assert wait_until(alice.is_peer_connected, timeout=P2P_CONNECTION_TIMEOUT), \
+            "Alice should see Bob as connected"
 
-        alice.wait_for_app_ready()
-        bob.wait_for_app_ready()
-
-        # Pair devices first
-        alice.navigate_to_connect()
-        alice_code = alice.get_pairing_code_from_connect_screen()
-        bob.navigate_to_connect()
-        bob.enter_peer_code(alice_code)
-
-        connected = False
-        for _ in range(6):
-            time.sleep(P2P_CONNECTION_TIMEOUT)
-            alice.go_back_to_home()
-            bob.go_back_to_home()
-            time.sleep(3)
-            if alice.is_peer_connected() or bob.is_peer_connected():
-                connected = True
-                break
+        # Kill Bob's app (simulate disconnect)
+        package_name = "com.zajel.zajel"
+        bob_driver.terminate_app(package_name)
 
-        assert connected, "Devices must be paired first"
+        # Alice's home screen should eventually update —
+        # peer should no longer show as "Connected"
+        disconnected = wait_until(
+            lambda: not alice.is_peer_connected(), timeout=DISCONNECT_TIMEOUT
+        )
+
+        assert disconnected, \
+            "After Bob disconnects, Alice should see peer as not connected"
+
+
+@pytest.mark.connection
+@pytest.mark.android
+class TestPairedRestarts:
+    """Restart scenarios run against one pairing shared by the class.
+
+    Pairing is persisted by the app, so each test only needs the devices to
+    have been paired once: the restarts themselves are what is under test.
+    Each test still passes on its own, whatever state the previous one
+    left the apps in.
+    """
+
+    @pytest.mark.slow
+    def test_cancel_connection(self, paired_devices):
+        """Start connecting to a peer → tap Cancel → peer status reverts."""
+        alice, bob = paired_devices
+        alice_driver = alice.driver
+        bob_driver = bob.driver
 
         # Now disconnect Bob and try to reconnect
         package_name = "com.zajel.zajel"
@@ -100,106 +116,38 @@ class TestConnectionStates:
         assert cancelled, "Should be able to cancel or see disconnected state"
 
     @pytest.mark.slow
-    def test_peer_disconnect_updates_status(self, device_pair, app_helper):
-        """Paired → kill Bob's app → Alice sees peer no longer 'Connected'."""
-        alice_driver = device_pair["alice"]
-        bob_driver = device_pair["bob"]
-
-        alice = app_helper(alice_driver)
-        bob = app_helper(bob_driver)
-
-        alice.wait_for_app_ready()
-        bob.wait_for_app_ready()
-
-        # Pair devices
-        alice.navigate_to_connect()
-        alice_code = alice.get_pairing_code_from_connect_screen()
-        bob.navigate_to_connect()
-        bob.enter_peer_code(alice_code)
-
-        connected = False
-        for _ in range(6):
-            time.sleep(P2P_CONNECTION_TIMEOUT)
-            alice.go_back_to_home()
-            bob.go_back_to_home()
-            time.sleep(3)
-            if alice.is_peer_connected():
-                connected = True
-                break
-
-        assert connected, "Alice should see Bob as connected"
-
-        # Kill Bob's app (simulate disconnect)
-        package_name = "com.zajel.zajel"
-        bob_driver.terminate_app(package_name)
-        time.sleep(10)
-
-        # Alice's home screen should eventually update —
-        # peer should no longer show as "Connected"
-        still_connected = True
-        for _ in range(6):
-            if not alice.is_peer_connected():
-                still_connected = False
-                break
-            time.sleep(5)
-
-        assert not still_connected, \
-            "After Bob disconnects, Alice should see peer as not connected"
-
-    @pytest.mark.slow
-    def test_multiple_restarts_reconnect(self, device_pair, app_helper):
-        """Pair → restart both 2x → devices still reconnect."""
-        alice_driver = device_pair["alice"]
-        bob_driver = device_pair["bob"]
-
-        alice = app_helper(alice_driver)
-        bob = app_helper(bob_driver)
-
-        alice.wait_for_app_ready()
-        bob.wait_for_app_ready()
-
-        # Pair devices
-        alice.navigate_to_connect()
-        alice_code = alice.get_pairing_code_from_connect_screen()
-        bob.navigate_to_connect()
-        bob.enter_peer_code(alice_code)
-
-        connected = False
-        for _ in range(6):
-            time.sleep(P2P_CONNECTION_TIMEOUT)
-            alice.go_back_to_home()
-            bob.go_back_to_home()
-            time.sleep(3)
-            if alice.is_peer_connected() or bob.is_peer_connected():
-                connected = True
-                break
-
-        assert connected, "Initial pairing must succeed"
+    def test_multiple_restarts_reconnect(self, paired_devices):
+        """Paired → restart both 2x → devices still reconnect."""
+        alice, bob = paired_devices
+        alice_driver = alice.driver
+        bob_driver = bob.driver
 
         package_name = "com.zajel.zajel"
 
-        # Restart cycle x2
+        # Restart cycle x2; both devices restart side by side
+        reconnected = False
         for cycle in range(2):
-            alice_driver.terminate_app(package_name)
-            bob_driver.terminate_app(package_name)
+            run_concurrently(
+                lambda: alice_driver.terminate_app(package_name),
+                lambda: bob_driver.terminate_app(package_name),
+            )
             time.sleep(2)
 
-            alice_driver.activate_app(package_name)
-            bob_driver.activate_app(package_name)
-
-            alice.wait_for_app_ready()
-            bob.wait_for_app_ready()
+            run_concurrently(
+                lambda: alice_driver.activate_app(package_name),
+                lambda: bob_driver.activate_app(package_name),
+            )
+            run_concurrently(alice.wait_for_app_ready, bob.wait_for_app_ready)
 
             # Trigger signaling reconnection
-            alice.navigate_to_connect()
-            bob.navigate_to_connect()
-            time.sleep(30)
+            run_concurrently(alice.navigate_to_connect, bob.navigate_to_connect)
+            run_concurrently(alice.go_back_to_home, bob.go_back_to_home)
 
-            alice.go_back_to_home()
-            bob.go_back_to_home()
-            time.sleep(3)
+            reconnected = wait_until(
+                lambda: alice.is_peer_connected() or bob.is_peer_connected(),
+                timeout=RECONNECT_TIMEOUT,
+            )
 
         # After 2 restarts, devices should still reconnect
-        reconnected = alice.is_peer_connected() or bob.is_peer_connected()
         assert reconnected, \
             "Devices should reconnect even after multiple restarts"
@@ -2,132 +2,100 @@
 
 import time
 import pytest
-from platforms.android_helper import AppHelper
-from config import P2P_CONNECTION_TIMEOUT, APP_LAUNCH_TIMEOUT
 
 PACKAGE_NAME = "com.zajel.zajel"
 
 
 @pytest.mark.contacts
 class TestContacts:
-    """Tests for contact naming, search, and detail screens."""
+    """Tests for the contacts list and search.
 
-    def _pair_devices(self, alice_helper, bob_helper, alice, bob):
-        """Pair two devices and verify connection."""
-        alice_helper.wait_for_app_ready()
-        bob_helper.wait_for_app_ready()
+    The devices are paired once for the whole class (paired_devices), so
+    these tests must not rename the peer.
+    """
 
-        alice_helper.navigate_to_connect()
-        alice_code = alice_helper.get_pairing_code_from_connect_screen()
-
-        bob_helper.navigate_to_connect()
-        bob_helper.enter_peer_code(alice_code)
+    def test_navigate_to_contacts(self, paired_devices):
+        """Verify contacts screen opens and shows paired peers."""
+        alice_helper, _ = paired_devices
 
-        connected = False
-        for _ in range(6):
-            time.sleep(P2P_CONNECTION_TIMEOUT)
-            alice_helper.go_back_to_home()
-            bob_helper.go_back_to_home()
-            time.sleep(3)
-            if alice_helper.is_peer_connected() or bob_helper.is_peer_connected():
-                connected = True
-                break
+        alice_helper.go_back_to_home()
+        alice_helper.navigate_to_contacts()
 
-        assert connected, "Devices must be paired"
+        # Only the contacts screen has a search field; its "Contacts" title
+        # would also match the home screen's Contacts button tooltip
+        alice_helper.wait_for(alice_helper.EDIT_TEXT)
 
-    def test_navigate_to_contacts(self, alice, bob):
-        """Verify contacts screen opens and shows paired peers."""
-        alice_helper = AppHelper(alice)
-        bob_helper = AppHelper(bob)
+        # ...and it lists the paired peer
+        alice_helper.wait_for(alice_helper.CONTACT_TILE)
 
-        self._pair_devices(alice_helper, bob_helper, alice, bob)
+    def test_search_contacts(self, paired_devices):
+        """A search query that matches no contact filters the list."""
+        alice_helper, _ = paired_devices
 
         alice_helper.go_back_to_home()
         alice_helper.navigate_to_contacts()
 
-        # Should see contacts screen with at least one entry
-        alice_helper._find("Contacts", timeout=10)
+        # The paired peer is listed until a query filters it out
+        alice_helper.wait_for(alice_helper.CONTACT_TILE)
+        alice_helper.search_contacts("zzz-no-such-contact")
 
-    def test_set_alias_displays_in_contacts(self, alice, bob):
-        """Set an alias for a peer and verify it appears in contacts."""
-        alice_helper = AppHelper(alice)
-        bob_helper = AppHelper(bob)
+        # The screen shows "No matches" only when the filtered list is empty
+        alice_helper.wait_until_visible("No matches", timeout=5)
+
+
+@pytest.mark.contacts
+@pytest.mark.destructive
+class TestContactsRestart:
+    """Contact tests that rename the peer or restart the app.
 
-        self._pair_devices(alice_helper, bob_helper, alice, bob)
+    Both leave the pairing in a state other tests do not expect, so each
+    pairs its own devices (fresh_paired_devices).
+    """
+
+    def test_set_alias_displays_in_contacts(self, fresh_paired_devices):
+        """Set an alias for a peer and verify it appears in contacts."""
+        alice_helper, _ = fresh_paired_devices
+        alice = alice_helper.driver
 
         # Navigate to contacts and open the peer
         alice_helper.go_back_to_home()
         alice_helper.navigate_to_contacts()
-        time.sleep(1)
 
         # Open the first contact (the paired peer)
         try:
-            alice.find_element(
-                "xpath",
-                "//*[contains(@content-desc, 'Peer') or "
-                "contains(@content-desc, 'Anonymous')]"
-            ).click()
-            time.sleep(1)
+            alice_helper.open_first_contact()
 
             # Set alias
             alice_helper.set_peer_alias("Mom")
-            time.sleep(1)
 
             # Go back to contacts and verify alias shows
             alice.back()
-            time.sleep(1)
             alice_helper._find("Mom", timeout=10)
         except Exception:
             pytest.skip("Contact detail not accessible in current UI state")
 
-    def test_search_contacts(self, alice, bob):
-        """Search contacts by name."""
-        alice_helper = AppHelper(alice)
-        bob_helper = AppHelper(bob)
-
-        self._pair_devices(alice_helper, bob_helper, alice, bob)
-
-        alice_helper.go_back_to_home()
-        alice_helper.navigate_to_contacts()
-        time.sleep(1)
-
-        # Search for something
-        alice_helper.search_contacts("Peer")
-        time.sleep(1)
-
-    def test_alias_persists_across_restart(self, alice, bob):
+    def test_alias_persists_across_restart(self, fresh_paired_devices):
         """Alias should persist after app restart."""
-        alice_helper = AppHelper(alice)
-        bob_helper = AppHelper(bob)
-
-        self._pair_devices(alice_helper, bob_helper, alice, bob)
+        alice_helper, _ = fresh_paired_devices
+        alice = alice_helper.driver
 
         # Set an alias
         alice_helper.go_back_to_home()
         alice_helper.navigate_to_contacts()
-        time.sleep(1)
 
         try:
-            alice.find_element(
-                "xpath",
-                "//*[contains(@content-desc, 'Peer') or "
-                "contains(@content-desc, 'Anonymous')]"
-            ).click()
-            time.sleep(1)
+            alice_helper.open_first_contact()
 
             alice_helper.set_peer_alias("TestAlias")
-            time.sleep(1)
 
             # Restart Alice's app
             alice.terminate_app(PACKAGE_NAME)
             time.sleep(2)
             alice.activate_app(PACKAGE_NAME)
             alice_helper.wait_for_app_ready()
-            time.sleep(3)
 
             # Navigate to contacts and verify alias persisted
             alice_helper.navigate_to_contacts()
-            time.sleep(1)
             alice_helper._find("TestAlias", timeout=10)
         except Exception:
             pytest.skip("Contact alias persistence test requires accessible contact detail")
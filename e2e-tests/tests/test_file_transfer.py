@@ -7,174 +7,151 @@ The test stages a file via adb push + media scanner, then interacts
 with the Android Documents UI file picker to select it.
 """
 
-import time
+import os
 import subprocess
+import tempfile
 import pytest
 
-from config import P2P_CONNECTION_TIMEOUT, ADB_PATH
+from config import ADB_PATH
+from polling import run_concurrently, wait_until
+
+TEST_FILE_CONTENT = "Zajel E2E test file content"
+LOCAL_TEST_FILE = os.path.join(tempfile.gettempdir(), "zajel_test.txt")
+
+
+def _sees_file(helper, timeout):
+    """Whether the test file's message shows up in helper's chat."""
+    try:
+        helper._find("zajel_test", timeout=timeout)
+        return True
+    except Exception:
+        return False
+
+
+def _adb(udid, *args, timeout, check=False):
+    """Run an adb command against udid, retrying once if it times out.
+
+    Timeouts are kept tight (the file is a few bytes) so a wedged adb
+    fails fast; a single retry at twice the timeout absorbs a slow
+    emulator without hiding a dead one.
+    """
+    cmd = [ADB_PATH, "-s", udid, *args]
+    try:
+        return subprocess.run(cmd, check=check, capture_output=True,
+                              text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        print(f"[adb] {args[0]} timed out after {timeout}s, retrying")
+        return subprocess.run(cmd, check=check, capture_output=True,
+                              text=True, timeout=timeout * 2)
+
+
+@pytest.fixture(scope="module")
+def staged_test_file(alice_udid):
+    """Push a test file to Alice's emulator's Downloads folder via adb.
+
+    Creates a small text file, pushes it, and triggers the media scanner
+    so the Documents UI file picker can find it. The content is static,
+    so this runs once for the module rather than once per test; the file
+    survives the per-test app data reset.
+    """
+    with open(LOCAL_TEST_FILE, 'w') as f:
+        f.write(TEST_FILE_CONTENT)
+
+    try:
+        _adb(alice_udid, "push", LOCAL_TEST_FILE,
+             "/sdcard/Download/zajel_test.txt", timeout=5, check=True)
+        # Trigger the media scanner so the file appears in the picker,
+        # and also scan via the content provider to ensure indexing.
+        # One adb shell session runs both; both are best effort.
+        _adb(alice_udid, "shell",
+             "am broadcast"
+             " -a android.intent.action.MEDIA_SCANNER_SCAN_FILE"
+             " -d file:///sdcard/Download/zajel_test.txt;"
+             " content call --method scan_volume"
+             " --uri content://media --arg external_primary",
+             timeout=5)
+        # Wait for the media scanner to index the file (best effort:
+        # the picker may still find it if the query is unsupported)
+        wait_until(
+            lambda: "zajel_test.txt" in _adb(
+                alice_udid, "shell",
+                "content", "query",
+                "--uri", "content://media/external/file",
+                "--projection", "_display_name",
+                "--where", "\"_display_name='zajel_test.txt'\"",
+                timeout=5,
+            ).stdout,
+            timeout=10,
+        )
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+        pytest.skip("Could not stage test file on emulator")
+
+
+@pytest.fixture(scope="class")
+def sent_file(paired_devices, staged_test_file):
+    """Alice sends the staged file to Bob once for the whole class.
+
+    Pairing, opening both chats and the transfer itself are the expensive
+    part; the tests only differ in which side they check. Returns
+    (alice_helper, bob_helper) with both chats open.
+    """
+    alice, bob = paired_devices
+
+    def _open_chat(helper):
+        helper.open_chat_with_peer()
+        # The send button is part of the chat screen's input row
+        helper.by_id("send_button", timeout=10)
+
+    run_concurrently(lambda: _open_chat(alice), lambda: _open_chat(bob))
+
+    # select_file_in_picker waits for the picker to list the file, with
+    # time to spare for the Documents UI to start
+    alice.tap_attach_file()
+    if not alice.select_file_in_picker("zajel_test", timeout=15):
+        pytest.skip("Could not select file in picker on this emulator")
+
+    # Wait until the app has processed the file and shows it in chat; if it
+    # never does, test_send_file reports that
+    _sees_file(alice, timeout=15)
+    return alice, bob
 
 
 @pytest.mark.file_transfer
 @pytest.mark.slow
 class TestFileTransfer:
-    """Test suite for file sharing between paired devices."""
-
-    @staticmethod
-    def _stage_test_file(emulator_port: int):
-        """Push a test file to the emulator's Downloads folder via adb.
-
-        Creates a small text file, pushes it, and triggers the media scanner
-        so the Documents UI file picker can find it.
-        """
-        import tempfile
-        import os
-
-        test_content = "Zajel E2E test file content"
-        tmp_path = os.path.join(tempfile.gettempdir(), "zajel_test.txt")
-        with open(tmp_path, 'w') as f:
-            f.write(test_content)
-
-        udid = f"emulator-{emulator_port}"
-        try:
-            subprocess.run(
-                [ADB_PATH, "-s", udid, "push", tmp_path,
-                 "/sdcard/Download/zajel_test.txt"],
-                check=True, capture_output=True, timeout=30
-            )
-            # Trigger the media scanner so the file appears in the picker
-            subprocess.run(
-                [ADB_PATH, "-s", udid, "shell",
-                 "am", "broadcast",
-                 "-a", "android.intent.action.MEDIA_SCANNER_SCAN_FILE",
-                 "-d", "file:///sdcard/Download/zajel_test.txt"],
-                capture_output=True, timeout=10
-            )
-            # Also use content provider to ensure indexing
-            subprocess.run(
-                [ADB_PATH, "-s", udid, "shell",
-                 "content", "call", "--method", "scan_volume",
-                 "--uri", "content://media",
-                 "--arg", "external_primary"],
-                capture_output=True, timeout=15
-            )
-            time.sleep(2)  # Give media scanner time to index
-            return True
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
-            return False
-
-    def _pair_and_open_chat(self, alice_driver, bob_driver, app_helper):
-        """Pair devices and open chat on both sides."""
-        alice = app_helper(alice_driver)
-        bob = app_helper(bob_driver)
-
-        alice.wait_for_app_ready()
-        bob.wait_for_app_ready()
-
-        alice.navigate_to_connect()
-        alice_code = alice.get_pairing_code_from_connect_screen()
-
-        bob.navigate_to_connect()
-        bob.enter_peer_code(alice_code)
-
-        connected = False
-        for _ in range(6):
-            time.sleep(P2P_CONNECTION_TIMEOUT)
-            alice.go_back_to_home()
-            bob.go_back_to_home()
-            time.sleep(3)
-            if alice.is_peer_connected() or bob.is_peer_connected():
-                connected = True
-                break
-
-        assert connected, "Devices must be paired for file transfer tests"
-
-        alice.open_chat_with_peer()
-        time.sleep(2)
-        bob.open_chat_with_peer()
-        time.sleep(2)
-
-        return alice, bob
-
-    def _send_file(self, alice):
-        """Have Alice select and send a file. Returns True if successful."""
-        alice.tap_attach_file()
-        time.sleep(3)
-
-        if not alice.select_file_in_picker("zajel_test"):
-            pytest.skip("Could not select file in picker on this emulator")
-
-        # Wait for the app to process the file and show it in chat
-        time.sleep(5)
-
-    def test_send_file(self, device_pair, app_helper):
-        """Attach file -> file message appears in sender's chat."""
-        if not self._stage_test_file(5554):
-            pytest.skip("Could not stage test file on emulator")
+    """Test suite for file sharing between paired devices.
 
-        alice, bob = self._pair_and_open_chat(
-            device_pair["alice"], device_pair["bob"], app_helper
-        )
+    One transfer (sent_file) is shared by the class; each test checks a
+    different side of it.
+    """
 
-        self._send_file(alice)
+    def test_send_file(self, sent_file):
+        """Attach file -> file message appears in sender's chat."""
+        alice, _ = sent_file
 
         # Verify a file message appears in Alice's chat.
         # The chat shows "Sending file: zajel_test.txt" as content,
         # and the file bubble displays the filename.
-        try:
-            alice._find("zajel_test", timeout=15)
-            sent = True
-        except Exception:
-            sent = False
-        assert sent, "File message should appear in sender's chat"
-
-    def test_receive_file(self, device_pair, app_helper):
-        """Sender's file appears in receiver's chat."""
-        if not self._stage_test_file(5554):
-            pytest.skip("Could not stage test file on emulator")
-
-        alice, bob = self._pair_and_open_chat(
-            device_pair["alice"], device_pair["bob"], app_helper
-        )
-
-        self._send_file(alice)
+        assert _sees_file(alice, timeout=15), \
+            "File message should appear in sender's chat"
 
-        # Wait for transfer to complete
-        time.sleep(10)
+    def test_receive_file(self, sent_file):
+        """Sender's file appears in receiver's chat."""
+        _, bob = sent_file
 
-        # Bob should see the file in their chat
-        try:
-            bob._find("zajel_test", timeout=15)
-            received = True
-        except Exception:
-            received = False
-        assert received, "File message should appear in receiver's chat"
+        # Bob should see the file in their chat once the transfer completes
+        assert _sees_file(bob, timeout=25), \
+            "File message should appear in receiver's chat"
 
-    def test_file_visible_both_sides(self, device_pair, app_helper):
+    def test_file_visible_both_sides(self, sent_file):
         """After file transfer, both sides see the file message."""
-        if not self._stage_test_file(5554):
-            pytest.skip("Could not stage test file on emulator")
+        alice, bob = sent_file
 
-        alice, bob = self._pair_and_open_chat(
-            device_pair["alice"], device_pair["bob"], app_helper
+        # Check both sides at once; the devices are independent
+        alice_sees, bob_sees = run_concurrently(
+            lambda: _sees_file(alice, timeout=15),
+            lambda: _sees_file(bob, timeout=25),
         )
 
-        self._send_file(alice)
-
-        time.sleep(10)
-
-        # Check both sides
-        alice_sees = False
-        bob_sees = False
-        try:
-            alice._find("zajel_test", timeout=15)
-            alice_sees = True
-        except Exception:
-            pass
-        try:
-            bob._find("zajel_test", timeout=15)
-            bob_sees = True
-        except Exception:
-            pass
-
         assert alice_sees and bob_sees, \
             f"Both should see file: alice={alice_sees}, bob={bob_sees}"
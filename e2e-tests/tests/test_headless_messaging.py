@@ -6,55 +6,29 @@ chats with Bob (headless client). The headless client can verify received
 messages programmatically and send messages that Alice sees in the UI.
 """
 
-import time
 import pytest
 
-from config import P2P_CONNECTION_TIMEOUT
-
 
 @pytest.mark.headless
 @pytest.mark.messaging
 class TestHeadlessMessaging:
-    """Messaging tests using headless client as the peer."""
-
-    def _pair_alice_with_headless_bob(self, alice, app_helper, headless_bob):
-        """Helper: pair Alice (emulator) with Bob (headless) and open chat."""
-        helper = app_helper(alice)
-        helper.wait_for_app_ready()
-
-        # Alice navigates to Connect screen
-        helper.navigate_to_connect()
-        helper.get_pairing_code_from_connect_screen()
-
-        # Alice enters Bob's (headless) code
-        helper.enter_peer_code(headless_bob.pairing_code)
-
-        # Wait for pairing and WebRTC connection
-        time.sleep(P2P_CONNECTION_TIMEOUT)
+    """Messaging tests using headless client as the peer.
 
-        helper.go_back_to_home()
-        time.sleep(3)
-
-        assert helper.is_peer_connected(), "Pairing with headless client must succeed"
-
-        # Alice opens chat with the connected peer
-        helper.open_chat_with_peer()
-        time.sleep(2)
-
-        return helper
+    Alice pairs with headless Bob once for the whole class (headless_chat);
+    each test only exchanges messages in the already-open chat.
+    """
 
     @pytest.mark.single_device
     @pytest.mark.slow
-    def test_send_message_to_headless(self, alice, app_helper, headless_bob):
+    def test_send_message_to_headless(self, headless_chat):
         """Alice sends a message → headless Bob receives it."""
-        helper = self._pair_alice_with_headless_bob(alice, app_helper, headless_bob)
+        helper, headless_bob = headless_chat
 
         # Alice sends a message
         helper.send_message("Hello from Alice!")
-        time.sleep(3)
 
         # Verify Alice sees her own message
-        assert helper.has_message("Hello from Alice!")
+        assert helper.has_message("Hello from Alice!", timeout=8)
 
         # Bob (headless) should receive the message
         msg = headless_bob.receive_message(timeout=15)
@@ -62,60 +36,53 @@ class TestHeadlessMessaging:
 
     @pytest.mark.single_device
     @pytest.mark.slow
-    def test_receive_message_from_headless(self, alice, app_helper, headless_bob):
+    def test_receive_message_from_headless(self, headless_chat):
         """Headless Bob sends a message → Alice sees it in the UI."""
-        helper = self._pair_alice_with_headless_bob(alice, app_helper, headless_bob)
+        helper, headless_bob = headless_chat
 
         # Bob (headless) sends a message
         peer_id = headless_bob.connected_peer.peer_id
         headless_bob.send_text(peer_id, "Hello from HeadlessBob!")
 
-        # Wait for message to arrive and render
-        time.sleep(5)
-
-        # Alice should see Bob's message in the chat
-        assert helper.has_message("Hello from HeadlessBob!")
+        # Alice should see Bob's message in the chat once it arrives
+        assert helper.has_message("Hello from HeadlessBob!", timeout=10)
 
     @pytest.mark.single_device
     @pytest.mark.slow
-    def test_bidirectional_messaging(self, alice, app_helper, headless_bob):
+    def test_bidirectional_messaging(self, headless_chat):
         """Alice and headless Bob exchange messages bidirectionally."""
-        helper = self._pair_alice_with_headless_bob(alice, app_helper, headless_bob)
+        helper, headless_bob = headless_chat
 
         peer_id = headless_bob.connected_peer.peer_id
 
         # Alice sends first message
         helper.send_message("Message 1 from Alice")
-        time.sleep(3)
 
         # Bob receives and replies
         msg1 = headless_bob.receive_message(timeout=15)
         assert msg1.content == "Message 1 from Alice"
 
         headless_bob.send_text(peer_id, "Reply 1 from Bob")
-        time.sleep(5)
 
         # Alice sees Bob's reply
-        assert helper.has_message("Reply 1 from Bob")
+        assert helper.has_message("Reply 1 from Bob", timeout=10)
 
         # Alice sends another
         helper.send_message("Message 2 from Alice")
-        time.sleep(3)
 
         msg2 = headless_bob.receive_message(timeout=15)
         assert msg2.content == "Message 2 from Alice"
 
     @pytest.mark.single_device
     @pytest.mark.slow
-    def test_long_message(self, alice, app_helper, headless_bob):
+    def test_long_message(self, headless_chat):
         """Headless Bob sends a long message → Alice receives it intact."""
-        helper = self._pair_alice_with_headless_bob(alice, app_helper, headless_bob)
+        helper, headless_bob = headless_chat
 
         peer_id = headless_bob.connected_peer.peer_id
         long_text = "A" * 500  # 500 characters
 
         headless_bob.send_text(peer_id, long_text)
-        time.sleep(5)
 
         # Alice should see the message (check for a distinctive substring)
-        assert helper.has_message("AAAAA")
+        assert helper.has_message("AAAAA", timeout=10)
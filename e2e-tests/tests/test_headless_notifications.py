@@ -6,11 +6,14 @@ Tests that the Android app fires system notifications via
 (headless client) while Alice's chat is not in the foreground.
 """
 
+import queue
+import shlex
 import subprocess
+import threading
 import time
 import pytest
 
-from config import P2P_CONNECTION_TIMEOUT, ADB_PATH
+from config import ADB_PATH
 
 
 def _get_device_id_from_driver(driver):
@@ -19,6 +22,95 @@ def _get_device_id_from_driver(driver):
     return caps.get("udid", caps.get("deviceUDID", "emulator-5554"))
 
 
+class _AdbShell:
+    """A long-lived ``adb shell`` on one device, reused across polls.
+
+    Polling with ``adb shell dumpsys ...`` starts a new adb client and
+    remote shell every iteration. Here each command is written to one open
+    shell and its output is read back up to a sentinel line. A reader
+    thread feeds stdout through a queue so every read has a deadline.
+    """
+
+    SENTINEL = "__ZAJEL_END__"
+
+    def __init__(self, device_id: str):
+        adb = ADB_PATH if ADB_PATH else "adb"
+        self._proc = subprocess.Popen(
+            [adb, "-s", device_id, "shell"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, text=True,
+            encoding="utf-8", errors="replace",
+        )
+        self._lines: queue.Queue = queue.Queue()
+        threading.Thread(target=self._read_stdout, daemon=True).start()
+
+    def _read_stdout(self):
+        for line in self._proc.stdout:
+            self._lines.put(line)
+        self._lines.put(None)  # EOF
+
+    @property
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def run(self, command: str, timeout: float = 10) -> str:
+        """Run a command in the shell and return its stdout.
+
+        Raises:
+            TimeoutError: If the output is not complete within ``timeout``
+                seconds; the shell is killed.
+            OSError: If the shell has exited.
+        """
+        self._proc.stdin.write(f"{command}; echo {self.SENTINEL}\n")
+        self._proc.stdin.flush()
+        deadline = time.monotonic() + timeout
+        lines = []
+        while True:
+            try:
+                line = self._lines.get(
+                    timeout=max(0.0, deadline - time.monotonic())
+                )
+            except queue.Empty:
+                self._proc.kill()
+                raise TimeoutError(f"adb shell: {command!r} timed out") from None
+            if line is None:
+                break
+            # The sentinel may follow output that did not end in a newline
+            head, found, _ = line.rstrip().partition(self.SENTINEL)
+            if found:
+                lines.append(head)
+                return "".join(lines)
+            lines.append(line)
+        raise OSError("adb shell exited")
+
+    def close(self):
+        try:
+            self._proc.stdin.close()
+            self._proc.wait(timeout=5)
+        except (subprocess.TimeoutExpired, OSError):
+            self._proc.kill()
+
+
+# device_id -> _AdbShell, closed when the module finishes
+_adb_shells: dict = {}
+
+
+def _adb_shell(device_id: str) -> _AdbShell:
+    """Get the open shell for a device, starting one if needed."""
+    shell = _adb_shells.get(device_id)
+    if shell is None or not shell.alive:
+        shell = _adb_shells[device_id] = _AdbShell(device_id)
+    return shell
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _close_adb_shells():
+    yield
+    for shell in _adb_shells.values():
+        shell.close()
+    _adb_shells.clear()
+
+
 def _check_android_notification(device_id: str, expected_text: str, timeout: int = 15) -> bool:
     """Poll adb dumpsys notification for expected text.
 
@@ -30,95 +122,88 @@ def _check_android_notification(device_id: str, expected_text: str, timeout: int
     Returns:
         True if notification found, False otherwise
     """
-    adb = ADB_PATH if ADB_PATH else "adb"
+    # Match on the device: only grep's verdict crosses adb, not the full
+    # (often 100KB+) dump
+    command = (
+        "dumpsys notification --noredact | "
+        f"grep -q -F -e {shlex.quote(expected_text)} && echo FOUND"
+    )
     deadline = time.time() + timeout
     while time.time() < deadline:
         try:
-            result = subprocess.run(
-                [adb, "-s", device_id, "shell", "dumpsys", "notification", "--noredact"],
-                capture_output=True, text=True, timeout=10
-            )
-            if expected_text in result.stdout:
+            remaining = max(1.0, deadline - time.time())
+            if "FOUND" in _adb_shell(device_id).run(command, timeout=min(10, remaining)):
                 return True
-        except (subprocess.TimeoutExpired, OSError):
-            pass
+        except OSError:
+            # Dead or wedged shell (killed on timeout); a new one starts
+            # next poll
+            _adb_shells.pop(device_id, None)
         time.sleep(2)
     return False
 
 
 def _clear_notifications(device_id: str):
-    """Clear all notifications on the device."""
-    adb = ADB_PATH if ADB_PATH else "adb"
+    """Clear all notifications on the device.
+
+    Goes through the same open shell the notification polls use.
+    """
     try:
-        subprocess.run(
-            [adb, "-s", device_id, "shell", "service", "call", "notification", "1"],
-            capture_output=True, timeout=5
-        )
-    except (subprocess.TimeoutExpired, OSError):
-        pass
+        _adb_shell(device_id).run("service call notification 1", timeout=5)
+    except OSError:
+        _adb_shells.pop(device_id, None)
 
 
 @pytest.mark.headless
 @pytest.mark.notifications
 class TestHeadlessNotifications:
-    """Notification tests using headless client as the peer."""
-
-    def _pair_and_go_home(self, alice, app_helper, headless_bob):
-        """Pair Alice with Bob and return to home screen (chat not open)."""
-        helper = app_helper(alice)
-        helper.wait_for_app_ready()
-
-        helper.navigate_to_connect()
-        helper.get_pairing_code_from_connect_screen()
-        helper.enter_peer_code(headless_bob.pairing_code)
+    """Notification tests using headless client as the peer.
 
-        time.sleep(P2P_CONNECTION_TIMEOUT)
-
-        helper.go_back_to_home()
-        time.sleep(3)
-
-        assert helper.is_peer_connected(), "Pairing must succeed"
-        return helper
+    Alice pairs with headless Bob once for the whole class
+    (headless_paired); each test starts from the home screen.
+    """
 
     @pytest.mark.single_device
     @pytest.mark.slow
-    def test_notification_fires_when_chat_closed(self, alice, app_helper, headless_bob):
+    def test_notification_fires_when_chat_closed(self, headless_paired):
         """Bob sends message while Alice is on home screen → notification fires."""
-        helper = self._pair_and_go_home(alice, app_helper, headless_bob)
+        helper, headless_bob = headless_paired
+        helper.go_back_to_home()
 
-        device_id = _get_device_id_from_driver(alice)
+        device_id = _get_device_id_from_driver(helper.driver)
         _clear_notifications(device_id)
 
         # Bob sends a message while Alice is NOT in the chat
         peer_id = headless_bob.connected_peer.peer_id
         headless_bob.send_text(peer_id, "Notification test message")
 
-        # Check for notification
+        # Check for a notification carrying the message. The package name
+        # would not do: dumpsys lists it in its per-app settings sections
+        # even when nothing is posted.
         found = _check_android_notification(
-            device_id, "com.zajel.app", timeout=15
+            device_id, "Notification test message", timeout=15
         )
         assert found, "Notification should appear when chat is not open"
 
     @pytest.mark.single_device
     @pytest.mark.slow
-    def test_no_notification_when_chat_open(self, alice, app_helper, headless_bob):
+    def test_no_notification_when_chat_open(self, headless_paired):
         """Bob sends message while Alice has the chat open → no new notification."""
-        helper = self._pair_and_go_home(alice, app_helper, headless_bob)
+        helper, headless_bob = headless_paired
+        helper.go_back_to_home()
 
         # Open chat with peer
         helper.open_chat_with_peer()
         time.sleep(2)
 
-        device_id = _get_device_id_from_driver(alice)
+        device_id = _get_device_id_from_driver(helper.driver)
         _clear_notifications(device_id)
 
         # Bob sends a message while Alice HAS the chat open
         peer_id = headless_bob.connected_peer.peer_id
         headless_bob.send_text(peer_id, "In-chat message")
-        time.sleep(5)
 
         # Alice should see the message in-chat
-        assert helper.has_message("In-chat message")
+        assert helper.has_message("In-chat message", timeout=10)
 
         # But no notification should be posted (message is visible in chat)
         # Note: This is a best-effort check — the app may still post
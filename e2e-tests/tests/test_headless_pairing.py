@@ -12,10 +12,10 @@ Flow:
 4. Both are connected via WebRTC data channel
 """
 
-import time
 import pytest
 
 from config import P2P_CONNECTION_TIMEOUT
+from polling import wait_until
 
 
 @pytest.mark.headless
@@ -45,15 +45,13 @@ class TestHeadlessPairing:
         # Alice enters Bob's code
         helper.enter_peer_code(bob_code)
 
-        # Wait for Bob (headless) to auto-accept and pair
-        time.sleep(P2P_CONNECTION_TIMEOUT)
-
-        # Go back to home screen to check connection status
+        # Go back to home screen and wait for Bob (headless) to auto-accept
+        # and pair
         helper.go_back_to_home()
-        time.sleep(3)
 
         # Verify Alice shows a connected peer
-        assert helper.is_peer_connected(), "Alice should show a connected peer"
+        assert wait_until(helper.is_peer_connected, timeout=P2P_CONNECTION_TIMEOUT + 3), \
+            "Alice should show a connected peer"
 
     @pytest.mark.single_device
     def test_headless_pairs_with_app_code(self, alice, app_helper, headless_bob):
@@ -69,13 +67,11 @@ class TestHeadlessPairing:
         # Bob (headless) pairs with Alice's code
         headless_bob.pair_with(alice_code)
 
-        time.sleep(P2P_CONNECTION_TIMEOUT)
-
         # Go back to home screen to check connection status
         helper.go_back_to_home()
-        time.sleep(3)
 
-        assert helper.is_peer_connected(), "Alice should show a connected peer"
+        assert wait_until(helper.is_peer_connected, timeout=P2P_CONNECTION_TIMEOUT + 3), \
+            "Alice should show a connected peer"
 
     @pytest.mark.single_device
     def test_pairing_codes_differ(self, alice, app_helper, headless_bob):
@@ -2,31 +2,33 @@
 
 import time
 import pytest
-from platforms.android_helper import AppHelper
-from config import APP_LAUNCH_TIMEOUT
 
 
 @pytest.mark.media_settings
 @pytest.mark.single_device
 class TestMediaSettings:
-    """Tests for audio and video device settings screen."""
+    """Tests for audio and video device settings screen.
 
-    def test_navigate_to_media_settings(self, alice):
+    The app is started once for the whole class (alice_app); each test
+    reopens the screen from home, so it starts scrolled to the top.
+    """
+
+    def test_navigate_to_media_settings(self, alice_app):
         """Verify media settings screen opens."""
-        helper = AppHelper(alice)
-        helper.wait_for_app_ready()
+        helper = alice_app
 
+        helper.go_back_to_home()
         helper.navigate_to_media_settings()
 
         # Should see the media settings sections
-        helper._find("Microphone", timeout=10)
-        helper._find("Camera", timeout=5)
+        helper.assert_all_visible("Microphone", "Camera", timeout=10)
 
-    def test_audio_processing_toggles(self, alice):
+    def test_audio_processing_toggles(self, alice_app):
         """Verify audio processing toggles are present and interactive."""
-        helper = AppHelper(alice)
-        helper.wait_for_app_ready()
+        helper = alice_app
+        alice = helper.driver
 
+        helper.go_back_to_home()
         helper.navigate_to_media_settings()
 
         # Scroll down to Audio Processing section
@@ -39,19 +41,16 @@ class TestMediaSettings:
 
         # Find and toggle noise suppression
         helper._find("Noise Suppression", timeout=10).click()
-        time.sleep(1)
-
-        # Find echo cancellation
-        helper._find("Echo Cancellation", timeout=5)
 
-        # Find auto gain control
-        helper._find("Auto Gain Control", timeout=5)
+        # Echo cancellation and auto gain control sit next to it
+        helper.assert_all_visible("Echo Cancellation", "Auto Gain Control", timeout=5)
 
-    def test_background_blur_toggle(self, alice):
+    def test_background_blur_toggle(self, alice_app):
         """Verify background blur toggle is present in media settings."""
-        helper = AppHelper(alice)
-        helper.wait_for_app_ready()
+        helper = alice_app
+        alice = helper.driver
 
+        helper.go_back_to_home()
         helper.navigate_to_media_settings()
 
         # Scroll to bottom
@@ -66,11 +65,12 @@ class TestMediaSettings:
 
         helper._find("Background Blur", timeout=10)
 
-    def test_refresh_devices(self, alice):
+    def test_refresh_devices(self, alice_app):
         """Verify refresh devices button works."""
-        helper = AppHelper(alice)
-        helper.wait_for_app_ready()
+        helper = alice_app
+        alice = helper.driver
 
+        helper.go_back_to_home()
         helper.navigate_to_media_settings()
 
         # Scroll until "Refresh Devices" is visible — it's at the bottom
@@ -4,10 +4,9 @@ E2E tests for messaging functionality.
 Tests sending and receiving messages between connected devices.
 """
 
-import time
 import pytest
 
-from config import P2P_CONNECTION_TIMEOUT
+from pairing import pair_devices
 
 
 @pytest.mark.messaging
@@ -19,24 +18,7 @@ class TestMessaging:
         alice_helper = app_helper(alice)
         bob_helper = app_helper(bob)
 
-        alice_helper.wait_for_app_ready()
-        bob_helper.wait_for_app_ready()
-
-        # Alice opens Connect screen and gets her code
-        alice_helper.navigate_to_connect()
-        alice_code = alice_helper.get_pairing_code_from_connect_screen()
-
-        # Bob opens Connect screen and enters Alice's code
-        bob_helper.navigate_to_connect()
-        bob_helper.enter_peer_code(alice_code)
-
-        time.sleep(P2P_CONNECTION_TIMEOUT)
-
-        # Go back to home screens
-        alice_helper.go_back_to_home()
-        bob_helper.go_back_to_home()
-        time.sleep(3)
-
+        assert pair_devices(alice_helper, bob_helper), "Devices must be paired"
         return alice_helper, bob_helper
 
     @pytest.mark.slow
@@ -48,16 +30,12 @@ class TestMessaging:
         # Verify connected
         assert alice_helper.is_peer_connected() or bob_helper.is_peer_connected()
 
-        # Alice opens chat with the connected peer
+        # Alice opens chat with the connected peer and sends a message
         alice_helper.open_chat_with_peer()
-        time.sleep(2)
-
-        # Alice sends a message
         alice_helper.send_message("Hello from Alice!")
-        time.sleep(3)
 
         # Verify Alice can see her sent message
-        assert alice_helper.has_message("Hello from Alice!")
+        assert alice_helper.has_message("Hello from Alice!", timeout=8)
 
     @pytest.mark.slow
     def test_message_received_on_other_device(self, device_pair, app_helper):
@@ -69,16 +47,12 @@ class TestMessaging:
 
         # Alice opens chat and sends a message
         alice_helper.open_chat_with_peer()
-        time.sleep(2)
         alice_helper.send_message("Can you see this?")
-        time.sleep(5)
 
-        # Bob opens chat with Alice
+        # Bob opens chat with Alice and should see her message
+        # once it has been delivered
         bob_helper.open_chat_with_peer()
-        time.sleep(2)
-
-        # Bob should see Alice's message
-        assert bob_helper.has_message("Can you see this?")
+        assert bob_helper.has_message("Can you see this?", timeout=12)
 
     @pytest.mark.slow
     def test_bidirectional_messaging(self, device_pair, app_helper):
@@ -90,17 +64,13 @@ class TestMessaging:
 
         # Alice opens chat and sends message
         alice_helper.open_chat_with_peer()
-        time.sleep(2)
         alice_helper.send_message("Hello Bob!")
-        time.sleep(3)
 
         # Bob opens chat and verifies Alice's message, then replies
         bob_helper.open_chat_with_peer()
-        time.sleep(2)
-        assert bob_helper.has_message("Hello Bob!")
+        assert bob_helper.has_message("Hello Bob!", timeout=10)
 
         bob_helper.send_message("Hi Alice!")
-        time.sleep(3)
 
         # Alice should see Bob's reply
-        assert alice_helper.has_message("Hi Alice!")
+        assert alice_helper.has_message("Hi Alice!", timeout=8)
@@ -11,7 +11,7 @@ Tests the block and unblock flows:
 import time
 import pytest
 
-from config import P2P_CONNECTION_TIMEOUT
+from pairing import pair_devices
 
 
 @pytest.mark.peer_management
@@ -24,26 +24,7 @@ class TestPeerManagement:
         alice = app_helper(alice_driver)
         bob = app_helper(bob_driver)
 
-        alice.wait_for_app_ready()
-        bob.wait_for_app_ready()
-
-        alice.navigate_to_connect()
-        alice_code = alice.get_pairing_code_from_connect_screen()
-
-        bob.navigate_to_connect()
-        bob.enter_peer_code(alice_code)
-
-        connected = False
-        for _ in range(6):
-            time.sleep(P2P_CONNECTION_TIMEOUT)
-            alice.go_back_to_home()
-            bob.go_back_to_home()
-            time.sleep(3)
-            if alice.is_peer_connected() or bob.is_peer_connected():
-                connected = True
-                break
-
-        assert connected, "Devices must be paired for peer management tests"
+        assert pair_devices(alice, bob), "Devices must be paired for peer management tests"
         return alice, bob
 
     def test_block_peer(self, device_pair, app_helper):
@@ -19,19 +19,26 @@ from config import SIGNALING_URL
 
 from zajel.client import ZajelHeadlessClient
 
+# Sample texts for test_unicode_messages: Latin, Arabic (RTL), Japanese,
+# emoji, and mixed scripts.
+UNICODE_MESSAGES = (
+    "Hello, World!",
+    "مرحبا بالعالم",
+    "こんにちは世界",
+    "🎉🔥💬",
+    "Mixed: Hello مرحبا 🌍",
+)
 
-@pytest.fixture
-def event_loop():
-    """Create a new event loop for each test."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
 
+def _client(**kwargs):
+    """Create a headless client with in-memory peer storage.
 
-@pytest.fixture
-def run(event_loop):
-    """Helper to run async code in the test's event loop."""
-    return lambda coro: event_loop.run_until_complete(coro)
+    Every client otherwise opens the shared on-disk zajel_headless.db,
+    so each test paid for file I/O and inherited peers from earlier tests.
+    """
+    return ZajelHeadlessClient(
+        signaling_url=SIGNALING_URL, db_path=":memory:", **kwargs
+    )
 
 
 @pytest.mark.headless
@@ -48,10 +55,10 @@ class TestProtocolHeadless:
         self._skip_if_no_signaling()
 
         async def _test():
-            async with ZajelHeadlessClient(
-                signaling_url=SIGNALING_URL, name="Alice", auto_accept_pairs=True
-            ) as alice, ZajelHeadlessClient(
-                signaling_url=SIGNALING_URL, name="Bob"
+            async with _client(
+                name="Alice", auto_accept_pairs=True
+            ) as alice, _client(
+                name="Bob"
             ) as bob:
                 alice_code = await alice.connect()
                 await bob.connect()
@@ -74,10 +81,10 @@ class TestProtocolHeadless:
         self._skip_if_no_signaling()
 
         async def _test():
-            async with ZajelHeadlessClient(
-                signaling_url=SIGNALING_URL, name="Alice", auto_accept_pairs=True
-            ) as alice, ZajelHeadlessClient(
-                signaling_url=SIGNALING_URL, name="Bob"
+            async with _client(
+                name="Alice", auto_accept_pairs=True
+            ) as alice, _client(
+                name="Bob"
             ) as bob:
                 alice_code = await alice.connect()
                 await bob.connect()
@@ -102,10 +109,10 @@ class TestProtocolHeadless:
         self._skip_if_no_signaling()
 
         async def _test():
-            async with ZajelHeadlessClient(
-                signaling_url=SIGNALING_URL, name="Alice", auto_accept_pairs=True
-            ) as alice, ZajelHeadlessClient(
-                signaling_url=SIGNALING_URL, name="Bob"
+            async with _client(
+                name="Alice", auto_accept_pairs=True
+            ) as alice, _client(
+                name="Bob"
             ) as bob:
                 alice_code = await alice.connect()
                 await bob.connect()
@@ -132,10 +139,10 @@ class TestProtocolHeadless:
         self._skip_if_no_signaling()
 
         async def _test():
-            async with ZajelHeadlessClient(
-                signaling_url=SIGNALING_URL, name="Alice", auto_accept_pairs=True
-            ) as alice, ZajelHeadlessClient(
-                signaling_url=SIGNALING_URL, name="Bob"
+            async with _client(
+                name="Alice", auto_accept_pairs=True
+            ) as alice, _client(
+                name="Bob"
             ) as bob:
                 alice_code = await alice.connect()
                 await bob.connect()
@@ -165,10 +172,10 @@ class TestProtocolHeadless:
         self._skip_if_no_signaling()
 
         async def _test():
-            async with ZajelHeadlessClient(
-                signaling_url=SIGNALING_URL, name="Alice", auto_accept_pairs=True
-            ) as alice, ZajelHeadlessClient(
-                signaling_url=SIGNALING_URL, name="Bob"
+            async with _client(
+                name="Alice", auto_accept_pairs=True
+            ) as alice, _client(
+                name="Bob"
             ) as bob:
                 alice_code = await alice.connect()
                 await bob.connect()
@@ -178,15 +185,7 @@ class TestProtocolHeadless:
                     bob.pair_with(alice_code),
                 )
 
-                test_strings = [
-                    "Hello, World!",
-                    "مرحبا بالعالم",
-                    "こんにちは世界",
-                    "🎉🔥💬",
-                    "Mixed: Hello مرحبا 🌍",
-                ]
-
-                for text in test_strings:
+                for text in UNICODE_MESSAGES:
                     await bob.send_text(bob_peer.peer_id, text)
                     msg = await alice.receive_message(timeout=10)
                     assert msg.content == text, f"Failed for: {text}"
@@ -198,11 +197,11 @@ class TestProtocolHeadless:
         self._skip_if_no_signaling()
 
         async def _test():
-            async with ZajelHeadlessClient(
-                signaling_url=SIGNALING_URL, name="Alice", auto_accept_pairs=True,
+            async with _client(
+                name="Alice", auto_accept_pairs=True,
                 receive_dir=tempfile.mkdtemp(),
-            ) as alice, ZajelHeadlessClient(
-                signaling_url=SIGNALING_URL, name="Bob"
+            ) as alice, _client(
+                name="Bob"
             ) as bob:
                 alice_code = await alice.connect()
                 await bob.connect()
@@ -239,10 +238,10 @@ class TestProtocolHeadless:
         self._skip_if_no_signaling()
 
         async def _test():
-            async with ZajelHeadlessClient(
-                signaling_url=SIGNALING_URL, name="Alice", auto_accept_pairs=True
-            ) as alice, ZajelHeadlessClient(
-                signaling_url=SIGNALING_URL, name="Bob"
+            async with _client(
+                name="Alice", auto_accept_pairs=True
+            ) as alice, _client(
+                name="Bob"
             ) as bob:
                 alice_code = await alice.connect()
                 await bob.connect()
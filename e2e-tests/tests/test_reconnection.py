@@ -10,7 +10,7 @@ Tests the automatic reconnection flow for trusted peers:
 import time
 import pytest
 
-from config import P2P_CONNECTION_TIMEOUT
+from pairing import pair_devices
 
 
 @pytest.mark.reconnection
@@ -24,30 +24,7 @@ class TestReconnection:
         alice_helper = app_helper(alice)
         bob_helper = app_helper(bob)
 
-        alice_helper.wait_for_app_ready()
-        bob_helper.wait_for_app_ready()
-
-        # Alice opens Connect screen and gets her code
-        alice_helper.navigate_to_connect()
-        alice_code = alice_helper.get_pairing_code_from_connect_screen()
-
-        # Bob opens Connect screen and enters Alice's code
-        bob_helper.navigate_to_connect()
-        bob_helper.enter_peer_code(alice_code)
-
-        # Wait for P2P connection with retry (TURN relay can be slow)
-        connected = False
-        for attempt in range(6):
-            time.sleep(P2P_CONNECTION_TIMEOUT)
-            alice_helper.go_back_to_home()
-            bob_helper.go_back_to_home()
-            time.sleep(3)
-
-            if alice_helper.is_peer_connected() or bob_helper.is_peer_connected():
-                connected = True
-                break
-
-        assert connected, "Initial pairing should succeed"
+        assert pair_devices(alice_helper, bob_helper), "Initial pairing should succeed"
 
         return alice_helper, bob_helper
 
@@ -9,7 +9,7 @@ needs a paired peer to verify it gets removed.
 import time
 import pytest
 
-from config import P2P_CONNECTION_TIMEOUT
+from pairing import pair_devices
 
 
 @pytest.mark.settings
@@ -161,22 +161,7 @@ class TestSettings:
         alice = app_helper(alice_driver)
         bob = app_helper(bob_driver)
 
-        alice.wait_for_app_ready()
-        bob.wait_for_app_ready()
-
-        # Pair devices
-        alice.navigate_to_connect()
-        alice_code = alice.get_pairing_code_from_connect_screen()
-        bob.navigate_to_connect()
-        bob.enter_peer_code(alice_code)
-        time.sleep(P2P_CONNECTION_TIMEOUT)
-
-        alice.go_back_to_home()
-        bob.go_back_to_home()
-        time.sleep(3)
-
-        # Verify paired
-        assert alice.is_peer_connected() or bob.is_peer_connected(), \
+        assert pair_devices(alice, bob), \
             "Devices should be paired before clear-all test"
 
         # Alice clears all data
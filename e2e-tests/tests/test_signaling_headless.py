@@ -15,20 +15,6 @@ from zajel.signaling import SignalingClient
 from zajel.crypto import CryptoService
 
 
-@pytest.fixture
-def event_loop():
-    """Create a new event loop for each test."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
-
-
-@pytest.fixture
-def run(event_loop):
-    """Helper to run async code in the test's event loop."""
-    return lambda coro: event_loop.run_until_complete(coro)
-
-
 @pytest.mark.headless
 @pytest.mark.protocol
 class TestSignalingHeadless:
@@ -533,13 +533,16 @@ class _ChatScreenState extends ConsumerState<ChatScreen>
                       child: CircularProgressIndicator(strokeWidth: 2),
                     ),
                   )
-                : IconButton(
-                    icon: Icon(
-                      Icons.send,
-                      color: Theme.of(context).colorScheme.primary,
+                : Semantics(
+                    identifier: 'send_button',
+                    child: IconButton(
+                      icon: Icon(
+                        Icons.send,
+                        color: Theme.of(context).colorScheme.primary,
+                      ),
+                      tooltip: 'Send message',
+                      onPressed: _sendMessage,
                     ),
-                    tooltip: 'Send message',
-                    onPressed: _sendMessage,
                   ),
           ],
         ),
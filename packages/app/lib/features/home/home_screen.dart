@@ -18,20 +18,29 @@ class HomeScreen extends ConsumerWidget {
       appBar: AppBar(
         title: const Text('Zajel'),
         actions: [
-          IconButton(
-            icon: const Icon(Icons.contacts),
-            onPressed: () => context.push('/contacts'),
-            tooltip: 'Contacts',
+          Semantics(
+            identifier: 'contacts_button',
+            child: IconButton(
+              icon: const Icon(Icons.contacts),
+              onPressed: () => context.push('/contacts'),
+              tooltip: 'Contacts',
+            ),
           ),
-          IconButton(
-            icon: const Icon(Icons.qr_code_scanner),
-            onPressed: () => context.push('/connect'),
-            tooltip: 'Connect to peer',
+          Semantics(
+            identifier: 'connect_button',
+            child: IconButton(
+              icon: const Icon(Icons.qr_code_scanner),
+              onPressed: () => context.push('/connect'),
+              tooltip: 'Connect to peer',
+            ),
           ),
-          IconButton(
-            icon: const Icon(Icons.settings),
-            onPressed: () => context.push('/settings'),
-            tooltip: 'Settings',
+          Semantics(
+            identifier: 'settings_button',
+            child: IconButton(
+              icon: const Icon(Icons.settings),
+              onPressed: () => context.push('/settings'),
+              tooltip: 'Settings',
+            ),
           ),
         ],
       ),
@@ -38,15 +38,19 @@ class CryptoService:
     def __init__(self):
         self._private_key: Optional[X25519PrivateKey] = None
         self._public_key_bytes: Optional[bytes] = None
+        self._public_key_b64: Optional[str] = None
         # peerId -> session key (32 bytes)
         self._session_keys: dict[str, bytes] = {}
         # peerId -> peer public key bytes
         self._peer_public_keys: dict[str, bytes] = {}
+        # peerId -> AEAD context built from the session key
+        self._ciphers: dict[str, ChaCha20Poly1305] = {}
 
     def initialize(self) -> None:
         """Generate a new X25519 key pair."""
         self._private_key = X25519PrivateKey.generate()
         self._public_key_bytes = self._private_key.public_key().public_bytes_raw()
+        self._public_key_b64 = base64.b64encode(self._public_key_bytes).decode()
 
     @property
     def public_key_bytes(self) -> bytes:
@@ -57,8 +61,10 @@ class CryptoService:
 
     @property
     def public_key_base64(self) -> str:
-        """Get our public key as base64."""
-        return base64.b64encode(self.public_key_bytes).decode()
+        """Get our public key as base64 (encoded once, in initialize)."""
+        if self._public_key_b64 is None:
+            raise RuntimeError("CryptoService not initialized")
+        return self._public_key_b64
 
     def perform_key_exchange(self, peer_id: str, peer_public_key_b64: str) -> bytes:
         """Perform X25519 key exchange with a peer.
@@ -87,9 +93,21 @@ class CryptoService:
             info=HKDF_INFO,
         ).derive(shared_secret)
 
-        self._session_keys[peer_id] = session_key
+        self._set_session_key(peer_id, session_key)
         return session_key
 
+    def _set_session_key(self, peer_id: str, key: bytes) -> None:
+        """Store a session key and the AEAD context derived from it."""
+        self._session_keys[peer_id] = key
+        self._ciphers[peer_id] = ChaCha20Poly1305(key)
+
+    def _cipher_for(self, peer_id: str) -> ChaCha20Poly1305:
+        """Get the cached AEAD context for a peer."""
+        aead = self._ciphers.get(peer_id)
+        if aead is None:
+            raise RuntimeError(f"No session key for peer {peer_id}")
+        return aead
+
     def encrypt(self, peer_id: str, plaintext: str) -> str:
         """Encrypt a message for a peer using ChaCha20-Poly1305.
 
@@ -100,12 +118,8 @@ class CryptoService:
         Returns:
             Base64-encoded ciphertext (nonce || ciphertext || mac).
         """
-        key = self._session_keys.get(peer_id)
-        if key is None:
-            raise RuntimeError(f"No session key for peer {peer_id}")
-
+        aead = self._cipher_for(peer_id)
         nonce = os.urandom(NONCE_SIZE)
-        aead = ChaCha20Poly1305(key)
         ciphertext = aead.encrypt(nonce, plaintext.encode(), None)
         # ciphertext includes the 16-byte MAC appended by the library
         return base64.b64encode(nonce + ciphertext).decode()
@@ -120,15 +134,11 @@ class CryptoService:
         Returns:
             The decrypted plaintext string.
         """
-        key = self._session_keys.get(peer_id)
-        if key is None:
-            raise RuntimeError(f"No session key for peer {peer_id}")
-
+        aead = self._cipher_for(peer_id)
         raw = base64.b64decode(ciphertext_b64)
         nonce = raw[:NONCE_SIZE]
         ciphertext = raw[NONCE_SIZE:]  # includes MAC
 
-        aead = ChaCha20Poly1305(key)
         plaintext = aead.decrypt(nonce, ciphertext, None)
         return plaintext.decode()
 
@@ -142,7 +152,7 @@ class CryptoService:
 
     def set_session_key(self, peer_id: str, key: bytes) -> None:
         """Restore a previously saved session key."""
-        self._session_keys[peer_id] = key
+        self._set_session_key(peer_id, key)
 
     def get_peer_public_key(self, peer_id: str) -> Optional[bytes]:
         """Get a peer's public key bytes."""
@@ -31,7 +31,7 @@ class MessageType(str, Enum):
     FILE_COMPLETE = "file_complete"
 
 
-@dataclass
+@dataclass(slots=True)
 class HandshakeMessage:
     """Key exchange handshake sent on data channel open."""
 
@@ -46,7 +46,7 @@ class HandshakeMessage:
         return HandshakeMessage(public_key=msg["publicKey"])
 
 
-@dataclass
+@dataclass(slots=True)
 class FileStartMessage:
     """Signals the beginning of a file transfer."""
 
@@ -75,7 +75,7 @@ class FileStartMessage:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FileChunkMessage:
     """A single chunk of a file transfer."""
 
@@ -101,7 +101,7 @@ class FileChunkMessage:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FileCompleteMessage:
     """Signals the end of a file transfer."""
 